@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import numpy as np
+from numba import njit
+
+# Row order of the histogram filled by score_and_bin
+SERIES = ('temperature', 'weather', 'sun_location', 'random', 'total')
+
+
+@njit('i8(f8)', cache=True, fastmath=True)
+def _bin(value: float) -> int:
+    return min(10, max(0, int(value + 0.5)))
+
+
+# Explicit signatures compile at import, and cache=True loads that from disk after the first run
+@njit('void(f8[:], f8[:], f8[:], f8[:], f8, f8, f8, i8[:, :])', cache=True, fastmath=True)
+def score_and_bin(
+        temperature: np.ndarray,
+        weather: np.ndarray,
+        random: np.ndarray,
+        sun_location: np.ndarray,
+        offset: float,
+        low: float,
+        high: float,
+        out: np.ndarray
+) -> None:
+    """ Weights, offsets and clips each sample's total, counting every series into out[5, 11] """
+    for i in range(temperature.shape[0]):
+        total = (
+            temperature[i] * 15 + weather[i] * 25 + random[i] * 20 + sun_location[i] * 40
+        ) * 0.01 + offset
+        if total < low:
+            total = low
+        elif total > high:
+            total = high
+        out[0, _bin(temperature[i])] += 1
+        out[1, _bin(weather[i])] += 1
+        out[2, _bin(sun_location[i])] += 1
+        out[3, _bin(random[i])] += 1
+        out[4, _bin(total)] += 1
@@ -5,8 +5,9 @@ from __future__ import annotations
 import datetime
 import json
 import logging
+import os
 import random
-from typing import Optional, TYPE_CHECKING, Union
+from typing import List, Optional, Tuple, TYPE_CHECKING, Union
 
 import appdirs
 import pathlib
@@ -14,9 +15,11 @@ import pyzipcode
 import requests
 import tzlocal
 
-from .constants import FEATURE_WEIGHTS, OPENMETEO_WEATHER_STATES, WEATHER_STATES
+from .constants import API_TIMEOUT, FEATURE_WEIGHTS, OPENMETEO_WEATHER_STATES, WEATHER_STATES
 from .utils import get_state
 
+logger = logging.getLogger(__name__)
+
 BOKTAI_STATE = get_state()
 if BOKTAI_STATE == ('mac', 'frozen', 'app'):
     pyzipcode.db_location = 'zipcodes.db'
@@ -126,7 +129,7 @@ class BoktaiConfig(object):
             with open(config_file, 'r') as fp:
                 config = json.load(fp=fp)
         except OSError:
-            logging.info('Could not open config file path, using defaults')
+            logger.info('Could not open config file path, using defaults')
         config['config_file'] = config_file
         return cls(**config)
 
@@ -137,18 +140,21 @@ class BoktaiConfig(object):
                 config_path.parent.mkdir(parents=True, exist_ok=True)
                 config_path.touch()
             except OSError:
-                logging.warning(f'Could not create config file at `{config_path}`, not saving')
+                logger.warning(f'Could not create config file at `{config_path}`, not saving')
                 return
         config_json = {}
         for key, value in self.__dict__.items():
             if key.startswith('_') or key == 'config_file':
                 continue
             config_json[key] = value
+        # Write a sibling file and swap it in, so an interrupted save never truncates the config
+        temp_path = config_path.with_name(config_path.name + '.tmp')
         try:
-            with config_path.open('w') as cfp:
+            with temp_path.open('w') as cfp:
                 json.dump(config_json, cfp, indent=4)
+            os.replace(temp_path, config_path)
         except OSError:
-            logging.warning(f'Could not write json to config file at `{config_path}`, not saving')
+            logger.warning(f'Could not write json to config file at `{config_path}`, not saving')
 
 
 class WeatherInfo(object):
@@ -163,9 +169,9 @@ class WeatherInfo(object):
             current_temp: float,
             visibility: int,
             weather_state: str,
-            sunrise: str,
-            sunset: str,
-            timestamp: str,
+            sunrise: Union[str, datetime.datetime],
+            sunset: Union[str, datetime.datetime],
+            timestamp: Union[str, datetime.datetime],
             avg_temp: Optional[float] = None,
             raw_weather_data: Optional[dict] = None,
             woeid_options: Optional[dict] = None,
@@ -199,7 +205,9 @@ class WeatherInfo(object):
         if self.manual:
             self._last_update = datetime.datetime.now()
             return
-        weather_req = requests.get(f'https://www.metaweather.com/api/location/{self.woeid}/')
+        weather_req = requests.get(
+            f'https://www.metaweather.com/api/location/{self.woeid}/', timeout=API_TIMEOUT
+        )
         weather_json = weather_req.json()
         self._raw_data = weather_json
         latest_weather = weather_json['consolidated_weather'][-1]
@@ -226,7 +234,8 @@ class WeatherInfo(object):
         timezone = str(tzlocal.get_localzone())
         current_hour = datetime.datetime.now().astimezone().strftime('%Y-%m-%dT%H:00')
         weather_req = requests.get(
-            f'https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={long}&current_weather=true&hourly=temperature_2m,precipitation,weathercode,cloudcover,cloudcover_low,cloudcover_mid,cloudcover_high,direct_radiation,diffuse_radiation&daily=weathercode,temperature_2m_max,temperature_2m_min,sunrise,sunset&windspeed_unit=mph&precipitation_unit=inch&timezone={timezone}'
+            f'https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={long}&current_weather=true&hourly=temperature_2m,precipitation,weathercode,cloudcover,cloudcover_low,cloudcover_mid,cloudcover_high,direct_radiation,diffuse_radiation&daily=weathercode,temperature_2m_max,temperature_2m_min,sunrise,sunset&windspeed_unit=mph&precipitation_unit=inch&timezone={timezone}',
+            timeout=API_TIMEOUT
         )
         weather_json = weather_req.json()
         data_index = weather_json['hourly']['time'].index(current_hour)
@@ -258,10 +267,14 @@ class WeatherInfo(object):
 
     @property
     def weather_timestamp(self) -> datetime.datetime:
+        if isinstance(self.timestamp, datetime.datetime):
+            return self.timestamp
         return datetime.datetime.strptime(self.timestamp, self.timestamp_format)
 
     @property
     def sunrise_timestamp(self) -> datetime.datetime:
+        if isinstance(self.sunrise, datetime.datetime):
+            return self.sunrise
         if len(self.sunset) == 32:
             tz = self.sunrise[-6:-3]
             tz += self.sunrise[-2:]
@@ -271,6 +284,8 @@ class WeatherInfo(object):
 
     @property
     def sunset_timestamp(self) -> datetime.datetime:
+        if isinstance(self.sunset, datetime.datetime):
+            return self.sunset
         if len(self.sunset) == 32:
             tx = self.sunset[-6:-3]
             tx += self.sunset[-2:]
@@ -317,13 +332,15 @@ class WeatherInfo(object):
         timezone = str(tzlocal.get_localzone())
         current_hour = datetime.datetime.now().astimezone().strftime('%Y-%m-%dT%H:00')
         weather_req = requests.get(
-            f'https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current_weather=true&hourly=temperature_2m,precipitation,weathercode,cloudcover,cloudcover_low,cloudcover_mid,cloudcover_high,direct_radiation,diffuse_radiation&daily=weathercode,temperature_2m_max,temperature_2m_min,sunrise,sunset&windspeed_unit=mph&precipitation_unit=inch&timezone={timezone}'
+            f'https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current_weather=true&hourly=temperature_2m,precipitation,weathercode,cloudcover,cloudcover_low,cloudcover_mid,cloudcover_high,direct_radiation,diffuse_radiation&daily=weathercode,temperature_2m_max,temperature_2m_min,sunrise,sunset&windspeed_unit=mph&precipitation_unit=inch&timezone={timezone}',
+            timeout=API_TIMEOUT
         )
         weather_json = weather_req.json()
         data_index = weather_json['hourly']['time'].index(current_hour)
         weather_state = OPENMETEO_WEATHER_STATES[int(weather_json['current_weather']['weathercode'])]
         location_req = requests.get(
-            f'https://geocode.maps.co/reverse?lat={latitude}&lon={longitude}'
+            f'https://geocode.maps.co/reverse?lat={latitude}&lon={longitude}',
+            timeout=API_TIMEOUT
         )
         location_json = location_req.json()
         try:
@@ -355,11 +372,14 @@ class WeatherInfo(object):
     def from_latlong(cls, latitude: float, longitude: float) -> WeatherInfo:
         latlong = str(latitude) + ',' + str(longitude)
         location_req = requests.get(
-            f'https://www.metaweather.com/api/location/search/?lattlong={latlong}'
+            f'https://www.metaweather.com/api/location/search/?lattlong={latlong}',
+            timeout=API_TIMEOUT
         )
         location_json = location_req.json()
         closest_woeid = location_json[0]['woeid']
-        weather_req = requests.get(f'https://www.metaweather.com/api/location/{closest_woeid}/')
+        weather_req = requests.get(
+            f'https://www.metaweather.com/api/location/{closest_woeid}/', timeout=API_TIMEOUT
+        )
         weather_json = weather_req.json()
         latest_weather = weather_json['consolidated_weather'][-1]
         return cls(
@@ -388,7 +408,8 @@ class WeatherInfo(object):
         timezone = str(tzlocal.get_localzone())
         current_hour = datetime.datetime.now().astimezone().strftime('%Y-%m-%dT%H:00')
         weather_req = requests.get(
-            f'https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={long}&current_weather=true&hourly=temperature_2m,precipitation,weathercode,cloudcover,cloudcover_low,cloudcover_mid,cloudcover_high,direct_radiation,diffuse_radiation&daily=weathercode,temperature_2m_max,temperature_2m_min,sunrise,sunset&windspeed_unit=mph&precipitation_unit=inch&timezone={timezone}'
+            f'https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={long}&current_weather=true&hourly=temperature_2m,precipitation,weathercode,cloudcover,cloudcover_low,cloudcover_mid,cloudcover_high,direct_radiation,diffuse_radiation&daily=weathercode,temperature_2m_max,temperature_2m_min,sunrise,sunset&windspeed_unit=mph&precipitation_unit=inch&timezone={timezone}',
+            timeout=API_TIMEOUT
         )
         weather_json = weather_req.json()
         data_index = weather_json['hourly']['time'].index(current_hour)
@@ -414,11 +435,14 @@ class WeatherInfo(object):
     def from_zip(cls, zipcode: int) -> WeatherInfo:
         latlong = zip_to_latlong(zipcode)
         location_req = requests.get(
-            f'https://www.metaweather.com/api/location/search/?lattlong={latlong}'
+            f'https://www.metaweather.com/api/location/search/?lattlong={latlong}',
+            timeout=API_TIMEOUT
         )
         location_json = location_req.json()
         closest_woeid = location_json[0]['woeid']
-        weather_req = requests.get(f'https://www.metaweather.com/api/location/{closest_woeid}/')
+        weather_req = requests.get(
+            f'https://www.metaweather.com/api/location/{closest_woeid}/', timeout=API_TIMEOUT
+        )
         weather_json = weather_req.json()
         latest_weather = weather_json['consolidated_weather'][-1]
         return cls(
@@ -572,15 +596,14 @@ class BoktaiSim(object):
         return self._calulate_sun_value(self.weather.sun_position)
 
     @staticmethod
-    def _calulate_sun_value(
+    def _sun_beta_parameters(
             sun_position: float,
             alpha_min: int = 225,
             alpha_max: int = 550,
             beta_min: int = 225,
             beta_max: int = 225
-    ) -> float:
-        if sun_position == 100.0 or sun_position == -1:
-            return 0
+    ) -> Tuple[float, float, float]:
+        """ Returns the position folded around noon and the beta distribution's alpha and beta """
         if sun_position > 50:
             sun_position = 100 - sun_position
         if alpha_min < alpha_max:
@@ -605,6 +628,21 @@ class BoktaiSim(object):
             beta = beta_precursor / 100
         else:
             beta = beta_max / 100
+        return sun_position, alpha, beta
+
+    @staticmethod
+    def _calulate_sun_value(
+            sun_position: float,
+            alpha_min: int = 225,
+            alpha_max: int = 550,
+            beta_min: int = 225,
+            beta_max: int = 225
+    ) -> float:
+        if sun_position == 100.0 or sun_position == -1:
+            return 0
+        sun_position, alpha, beta = BoktaiSim._sun_beta_parameters(
+            sun_position, alpha_min, alpha_max, beta_min, beta_max
+        )
         random_value = random.betavariate(alpha, beta) * 10
         if sun_position <= 5 and random_value > 2:
             random_value -= 2
@@ -645,25 +683,32 @@ class BoktaiSim(object):
     @property
     def value(self) -> int:
         """ Return weighted average of all values, only polling random ones once. """
+        sun_position = self.weather.sun_position
+        logger.debug(f'Sun position: {sun_position}')
+        final_result = self._bar_value(sun_position)
+        logger.debug(f'Final Bar Value: {final_result}')
+        return final_result
+
+    def values(self, count: int) -> List[int]:
+        """ Return count bar values, working out the sun position once for all of them. """
+        sun_position = self.weather.sun_position
+        return [self._bar_value(sun_position) for _ in range(count)]
+
+    def _bar_value(self, sun_position: float) -> int:
         values = {
             'temperature': self.temperature_value,
             'weather': self.weather_value,
-            'sun_location': self.random_sun_value,
+            'sun_location': self._calulate_sun_value(sun_position),
             'random': self.random_weather_value
         }
-        logging.debug(f'Generated values: {values}')
         value_sum = 0
         value_count = 0
-        value_names = ['temperature', 'weather', 'sun_location', 'random']
-        for value_name in value_names:
-            value_sum += values[value_name] * FEATURE_WEIGHTS[value_name]
+        for value_name, value in values.items():
+            value_sum += value * FEATURE_WEIGHTS[value_name]
             value_count += FEATURE_WEIGHTS[value_name]
-        logging.debug(f'Number of values: {value_count}, Sum Total: {value_sum}')
-        logging.debug(f'Sun position: {self.weather.sun_position}')
-        if self.lunar_mode and \
-                (self.weather.sun_position == 100.0 or self.weather.sun_position == -1):
+        if self.lunar_mode and (sun_position == 100.0 or sun_position == -1):
             return round(self._version_return(value_sum / value_count / 2))
-        if self.weather.sun_position == 100.0 or self.weather.sun_position == -1:
+        if sun_position == 100.0 or sun_position == -1:
             return 0
         initial_result = value_sum / value_count
         initial_result = initial_result + WEATHER_STATES[self.weather.weather_state]['mod']
@@ -671,9 +716,7 @@ class BoktaiSim(object):
             initial_result = 10
         if initial_result < 0:
             initial_result = 0
-        final_result = round(self._version_return(initial_result))
-        logging.debug(f'Final Bar Value: {final_result}')
-        return final_result
+        return round(self._version_return(initial_result))
 
     def _version_return(
             self,
@@ -741,9 +784,9 @@ def c_to_f(celsius: Union[str, float, int]) -> float:
 
 def check_api() -> bool:
     try:
-        requests.get('https://www.metaweather.com/api/')
+        requests.get('https://www.metaweather.com/api/', timeout=API_TIMEOUT)
         return True
-    except requests.exceptions.ConnectionError:
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
         return False
 
 
@@ -4,6 +4,9 @@ import datetime
 
 LOCAL_TIMEZONE = datetime.datetime.now(datetime.timezone.utc).astimezone().tzinfo
 
+# Seconds before a weather or geocoding request is abandoned
+API_TIMEOUT = 10
+
 # Openmeteo uses different weather codes than metaweather, and they don't always neatly mesh.
 OPENMETEO_WEATHER_STATES = {
     0: 'c',     # Clear Sky
@@ -228,6 +231,25 @@ IMAGES = [
     'c.gif'
 ]
 
+# Icons shown directly by tkinter, decoded once at start
+ICON_IMAGES = [
+    'Solar_Sensor_Icon.gif',
+    'Rising.gif',
+    'At Apex.gif',
+    'Descending.gif',
+    'Moonlight.gif',
+    'sn.gif',
+    'sl.gif',
+    'h.gif',
+    't.gif',
+    'hr.gif',
+    'lr.gif',
+    's.gif',
+    'hc.gif',
+    'lc.gif',
+    'c.gif'
+]
+
 SOUNDS = {
     'open': {
         'file': 'open.wav',
@@ -1,45 +1,105 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import collections
+import concurrent.futures
 import datetime
-import importlib.resources as pkg_resources
+import functools
+import importlib.resources
 import logging
 import os
 import pathlib
+import queue
 from PIL import Image, ImageTk
-import requests
-import simpleaudio
 import sys
+import threading
 import time
 import tkinter
 from tkinter import font, messagebox
 import tkinter.ttk
-from typing import Dict, Optional, Union
+import types
+from typing import Any, Dict, List, Optional, Tuple, Union
 import webbrowser
 
 from .classes import BoktaiConfig, BoktaiSim, c_to_f, f_to_c, WeatherInfo, zip_to_latlong
-from .constants import BOKTAI_METER, IMAGES, LOCAL_TIMEZONE, SOUNDS, WEATHER_STATES,\
+from .constants import BOKTAI_METER, ICON_IMAGES, IMAGES, LOCAL_TIMEZONE, SOUNDS, WEATHER_STATES,\
     WEATHER_STATES_REVERSE
 from .utils import get_state
 from .version import __version__
 
 BOKTAI_STATE = get_state()
+_RES = importlib.resources.files('boktaisim.resources')
+_SETS_WINDOW_ICON = BOKTAI_STATE[0] == 'windows'
+_HOURS = tuple(map(str, range(0, 24)))
+_MINUTES = tuple(map(str, range(0, 60)))
+_WEATHER_OPTIONS = tuple(WEATHER_STATES_REVERSE)
+_WEATHER_NAMES = types.MappingProxyType(
+    {state: data['name'] for state, data in WEATHER_STATES.items()}
+)
+_TEMP_LABELS = types.MappingProxyType({
+    scale: types.MappingProxyType({
+        'min': f'Min °{scale}: {{}}',
+        'avg': f'Avg °{scale}: {{}}',
+        'current': f'Current °{scale}: {{}}',
+        'max': f'Max °{scale}: {{}}'
+    })
+    for scale in ('C', 'F')
+})
+_BOUND_WIDGETS = (
+    'area_notebook', 'version_combo', 'zipcode_entry', 'lat_entry', 'lon_entry',
+    'min_f_entry', 'avg_f_entry', 'max_f_entry'
+)
+_ALERT_SOUND_OPTIONS = ('chime1', 'chime2', 'boktai', 'taiyou')
+_BG_KWARGS = types.MappingProxyType({'bg': '#ECECEC', 'highlightbackground': '#ECECEC'})
+_LOG_TAGS = (
+    ('INFO', 'black', 0),
+    ('DEBUG', 'blue', 0),
+    ('WARNING', 'orange', 0),
+    ('ERROR', 'red', 0),
+    ('CRITICAL', 'red', 1)
+)
+_ICON_DEFAULT_WEATHER = 'c.gif'
+_ICON_DEFAULT_SUN = 'At Apex.gif'
 
 if BOKTAI_STATE[0:2] == ('windows', 'frozen'):
     os.chdir(str(pathlib.Path(sys.executable).parent))
 
 
+def _tcl_value(value: Any) -> str:
+    """ Formats a grid option value for use in a Tcl script """
+    if isinstance(value, (tuple, list)):
+        return '{' + ' '.join(str(item) for item in value) + '}'
+    return str(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_wave(file_name: str):
+    """ Loads a wav file from the resources, shared between all windows """
+    import simpleaudio
+
+    if BOKTAI_STATE[0:2] == ('windows', 'frozen'):
+        return simpleaudio.WaveObject.from_wave_file(f'resources/{file_name}')
+    with importlib.resources.as_file(_RES / file_name) as sound_path:
+        return simpleaudio.WaveObject.from_wave_file(str(sound_path))
+
+
 class WindowManager(object):
+    _TEXT_FORMATTER = logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(message)s", "%Y-%m-%d %H:%M:%S"
+    )
+
     def __init__(
             self,
             config_file: Optional[str] = None
     ) -> None:
-        self.logger = logging.getLogger()
+        self.logger = logging.getLogger('boktaisim')
+        self.logger.propagate = False
         self.window = tkinter.Tk()
         self.boktaisim: Optional[BoktaiSim] = None
         self.config = BoktaiConfig.from_json(config_file)
         self.logger.setLevel(logging.getLevelName(self.config.logging_level))
         self._current_theme = None
+        self._themes_available: Optional[Tuple[str, ...]] = None
         self._last_value = None
         self._last_version = None
         self._last_temp_scale = None
@@ -50,14 +110,32 @@ class WindowManager(object):
         self._last_win_size = ''
         self._canvas_width = 0
         self._image_containers: Dict[str, ImageHandler] = {}
-        self._tk_variables = {}
+        self._gridded_version: Optional[int] = None
+        self._tk_variables = types.SimpleNamespace()
         self._sim_dict = {}
+        # Only the latest Manual sim is kept, every slider or entry change makes a new key
+        self._manual_sim: Optional[Tuple[Tuple[Any, ...], BoktaiSim]] = None
+        self._last_rendered: Dict[str, str] = {}
+        self._save_after_id: Optional[str] = None
+        self._save_lock = threading.Lock()
+        self._save_thread: Optional[threading.Thread] = None
+        self._fetch_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._fetch_in_flight = False
+        self._fetch_results: queue.Queue = queue.Queue()
+        self._text_handler: Optional['TextHandler'] = None
+        self._tab_parsers = {
+            'Zipcode': self._parse_zipcode,
+            'Lat/Lon': self._parse_latlon,
+            'Manual': self._parse_manual
+        }
         self._sound_dict = {}
+        self._playable: Dict[str, Any] = {}
         self._widget_dict = {}
         self._imgs = {}
+        self._tk_imgs: Dict[str, tkinter.PhotoImage] = {}
         self._select_link_cursor()
         self._init_image_paths()
-        self._init_sound_dict()
+        self._refresh_playable()
         self._set_icon()
 
     def _select_link_cursor(self) -> None:
@@ -68,36 +146,40 @@ class WindowManager(object):
         else:
             self._link_cursor = 'hand1'
 
-    def _init_sound_dict(self) -> None:
-        self._sound_dict = SOUNDS.copy()
-        if BOKTAI_STATE[0:2] == ('windows', 'frozen'):
-            for sound_name, sound_data in SOUNDS.items():
-                if not sound_data:
-                    self._sound_dict[sound_name] = None
-                    continue
-                sound_path = f'resources/{sound_data["file"]}'
-                audio_segment = simpleaudio.WaveObject.from_wave_file(str(sound_path))
-                self._sound_dict[sound_name]['segment'] = audio_segment
-            self._sound_dict['bar_update']['file'] = \
-                f'resources/{self.config.alert_sound_option}.wav'
-            audio_segment = simpleaudio.WaveObject.from_wave_file(
-                self._sound_dict['bar_update']['file']
-            )
-            self._sound_dict['bar_update']['segment'] = audio_segment
-        else:
-            for sound_name, sound_data in SOUNDS.items():
-                if not sound_data:
-                    self._sound_dict[sound_name] = None
-                    continue
-                with pkg_resources.path('boktaisim.resources', sound_data['file']) as sound_path:
-                    audio_segment = simpleaudio.WaveObject.from_wave_file(str(sound_path))
-                    self._sound_dict[sound_name]['segment'] = audio_segment
-            self._sound_dict['bar_update']['file'] = f'{self.config.alert_sound_option}.wav'
-            with pkg_resources.path(
-                    'boktaisim.resources', f'{self.config.alert_sound_option}.wav'
-            ) as sound_path:
-                audio_segment = simpleaudio.WaveObject.from_wave_file(str(sound_path))
-                self._sound_dict['bar_update']['segment'] = audio_segment
+    def _ensure_sounds(self) -> None:
+        """ Loads the sounds on first use, so fully muted sessions never touch the audio files """
+        if self._sound_dict:
+            return
+        for sound_name, sound_data in SOUNDS.items():
+            if not sound_data:
+                self._sound_dict[sound_name] = None
+                continue
+            self._sound_dict[sound_name] = {
+                **sound_data, 'segment': _load_wave(sound_data['file'])
+            }
+        self._sound_dict['bar_update']['file'] = f'{self.config.alert_sound_option}.wav'
+        self._sound_dict['bar_update']['segment'] = \
+            _load_wave(self._sound_dict['bar_update']['file'])
+        # Warm the wave cache so switching the alert sound never parses a file in the handler
+        for option in _ALERT_SOUND_OPTIONS:
+            _load_wave(f'{option}.wav')
+
+    def _refresh_playable(self) -> None:
+        """ Maps each sound that is currently allowed to play to its loaded wave """
+        muted = set()
+        if self.config.mute_alert_sounds:
+            muted.add('alert')
+        if self.config.mute_flavor_sounds:
+            muted.add('flavor')
+        if len(muted) == 2:
+            self._playable = {}
+            return
+        self._ensure_sounds()
+        self._playable = {
+            sound_name: sound_data['segment']
+            for sound_name, sound_data in self._sound_dict.items()
+            if sound_data and sound_data['segment'] and sound_data['type'] not in muted
+        }
 
     def _init_image_paths(self) -> None:
         for image_name in IMAGES:
@@ -106,21 +188,17 @@ class WindowManager(object):
             elif BOKTAI_STATE[0:2] == ('windows', 'frozen'):
                 self._imgs[image_name] = f'resources/{image_name}'
             else:
-                with pkg_resources.path('boktaisim.resources', image_name) as image_path:
-                    self._imgs[image_name] = image_path
-            continue
+                self._imgs[image_name] = str(_RES / image_name)
+        for image_name in ICON_IMAGES:
+            self._tk_imgs[image_name] = tkinter.PhotoImage(
+                master=self.window, file=self._imgs[image_name]
+            )
 
     def _set_icon(self) -> None:
-        if BOKTAI_STATE[0] == 'windows':
+        # Only Windows gets a window icon: there's no actual way to set one on Mac with tkinter :'(
+        # and the xbm icon on Linux is currently disabled.
+        if _SETS_WINDOW_ICON:
             self.window.iconbitmap(self._imgs["boktaisim_icon.ico"])
-            pass
-        elif BOKTAI_STATE[0] == 'mac':
-            # Looks like there's no actual way to set an icon on Mac with tkinter :'(
-            # self.window.iconbitmap(self._imgs["boktaisim_icon.gif"])
-            pass
-        else:
-            return
-            self.window.iconbitmap(self._imgs["boktaisim_icon.xbm"])
 
     def main(self) -> None:
         self._main_font = font.Font(self.window, family='TkDefaultFont')
@@ -129,17 +207,15 @@ class WindowManager(object):
         self.window.minsize(405, 480)
         self.window.bind('<Configure>', self._resize_window)
         style = tkinter.ttk.Style(self.window)
-        hours = list(range(0, 24))
-        minutes = list(range(0, 60))
 
         style.theme_use("classic")
-        self.window.configure(bg='#ECECEC')
-        tkinter.ttk.Style().configure('custom.TButton', foreground='black', background='#ECECEC')
-        tkinter.ttk.Style().configure('custom.TRadiobutton', foreground='black')
-        tkinter.ttk.Style().configure('custom.TCheckbutton', foreground='black')
-        tkinter.ttk.Style().configure('centered.TNotebook', tabposition='n')
-        tkinter.ttk.Style().configure('custom.TNotebook')
-        tkinter.ttk.Style().configure('custom.TCombobox')
+        self.window.configure(bg=_BG_KWARGS['bg'])
+        style.configure('custom.TButton', foreground='black', background=_BG_KWARGS['bg'])
+        style.configure('custom.TRadiobutton', foreground='black')
+        style.configure('custom.TCheckbutton', foreground='black')
+        style.configure('centered.TNotebook', tabposition='n')
+        style.configure('custom.TNotebook')
+        style.configure('custom.TCombobox')
 
         style.theme_create(
             "boktai",
@@ -168,7 +244,7 @@ class WindowManager(object):
         )
 
         self.window.title('Stiles\' Solar Sensor Simulator for the Boktai Trilogy')
-        tkinter.ttk.Style().theme_use(self.config.theme)
+        style.theme_use(self.config.theme)
         master_notebook = tkinter.ttk.Notebook(
             self.window, style='custom.TNotebook', name='master_notebook'
         )
@@ -187,44 +263,18 @@ class WindowManager(object):
         logging_text.configure(
             yscrollcommand=logging_vertical_scroll.set, xscrollcommand=logging_horizontal_scroll.set
         )
-        logging_text.tag_config('INFO', foreground='black')
-        logging_text.tag_config('DEBUG', foreground='blue')
-        logging_text.tag_config('WARNING', foreground='orange')
-        logging_text.tag_config('ERROR', foreground='red')
-        logging_text.tag_config('CRITICAL', foreground='red', underline=1)
-        text_handler = TextHandler(logging_text)
-        text_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s",
-                                           "%Y-%m-%d %H:%M:%S")
-        text_handler.setFormatter(text_formatter)
-        self.logger.addHandler(text_handler)
-        logging.info('Solar Sensor Simulator starting up')
+        for tag_name, foreground, underline in _LOG_TAGS:
+            logging_text.tag_config(tag_name, foreground=foreground, underline=underline)
+        self._text_handler = TextHandler(logging_text)
+        self._text_handler.setFormatter(self._TEXT_FORMATTER)
+        self.logger.addHandler(self._text_handler)
+        self.logger.info('Solar Sensor Simulator starting up')
         master_notebook.add(simulator_frame, text='Simulator')
         master_notebook.add(options_frame, text='Options')
         master_notebook.add(logging_frame, text='Logging')
         simulator_frame.bind('<Return>', self.do_update)
 
         middle_spacing_label = tkinter.Label(simulator_frame, text=" ", name='middle_spacing_label')
-        self._image_containers['bt1_logo'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai1_logo.gif"],
-            version=1,
-            parent=simulator_frame,
-            name='boktai1_logo',
-            container_type='Label'
-        )
-        self._image_containers['bt2_logo'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai2_logo.gif"],
-            version=2,
-            parent=simulator_frame,
-            name='boktai2_logo',
-            container_type='Label'
-        )
-        self._image_containers['bt3_logo'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai3_logo.gif"],
-            version=3,
-            parent=simulator_frame,
-            name='boktai3_logo',
-            container_type='Label'
-        )
         area_notebook = tkinter.ttk.Notebook(
             simulator_frame, style='centered.TNotebook', name='area_notebook'
         )
@@ -251,19 +301,13 @@ class WindowManager(object):
             name='button'
         )
         zipcode_label = tkinter.Label(zipcode_frame, text="Zipcode: ", name='zipcode_label')
-        zipcode_entry = tkinter.Entry(
-            zipcode_frame, width=5, text=self.config.zipcode, name='zipcode_entry'
-        )
-        if self.config.zipcode:
-            zipcode_entry.insert(0, self.config.zipcode)
+        zipcode_entry = tkinter.Entry(zipcode_frame, width=5, name='zipcode_entry')
         zipcode_note_label = tkinter.Label(
             zipcode_frame, text='USA zipcodes only, for \nother locations, use Lat/Lon',
             font="TkSmallCaptionFont", name='zipcode_note_label'
         )
         lat_label = tkinter.Label(latlon_frame, text='Latitude: ', name='lat_label')
         lat_entry = tkinter.Entry(latlon_frame, width=10, name='lat_entry')
-        if self.config.lat:
-            lat_entry.insert(0, self.config.lat)
         lon_label = tkinter.Label(latlon_frame, text='Longitude: ', name='lon_label')
         lon_entry = tkinter.Entry(latlon_frame, width=10, name='lon_entry')
         latlon_note_label = tkinter.Label(
@@ -271,8 +315,6 @@ class WindowManager(object):
             text='Click here to find your lat/lon',
             fg="blue", cursor=self._link_cursor, name='latlon_note_label'
         )
-        if self.config.lon:
-            lon_entry.insert(0, self.config.lon)
         min_f_label = tkinter.Label(
             manual_frame, text=f'Min °{self.config.temp_scale}: ', name='min_f_label'
         )
@@ -294,39 +336,42 @@ class WindowManager(object):
             if self.config.max_f:
                 max_f = self.config.max_f
         min_f_entry = tkinter.Entry(manual_frame, width=4, name='min_f_entry')
-        if min_f:
-            min_f_entry.insert(0, min_f)
         avg_f_label = tkinter.Label(
             manual_frame, text=f'Avg °{self.config.temp_scale}: ', name='avg_f_label'
         )
         avg_f_entry = tkinter.Entry(manual_frame, width=4, name='avg_f_entry')
-        if avg_f:
-            avg_f_entry.insert(0, avg_f)
         max_f_label = tkinter.Label(
             manual_frame, text=f'Max °{self.config.temp_scale}: ', name='max_f_label'
         )
         max_f_entry = tkinter.Entry(manual_frame, width=4, name='max_f_entry')
-        if max_f:
-            max_f_entry.insert(0, max_f)
+        for entry, value in (
+                (zipcode_entry, self.config.zipcode),
+                (lat_entry, self.config.lat),
+                (lon_entry, self.config.lon),
+                (min_f_entry, min_f),
+                (avg_f_entry, avg_f),
+                (max_f_entry, max_f)
+        ):
+            if value:
+                entry.insert(0, value)
         weather_state_frame = tkinter.Frame(manual_frame, name='weather_state_frame')
         weather_state_entry_label = tkinter.Label(
             weather_state_frame,
             text='Weather: ',
             name='weather_state_entry_label'
         )
-        self._tk_variables['weather_state_option'] = tkinter.StringVar()
+        self._tk_variables.weather_state_option = tkinter.StringVar()
         if self.config.weather:
-            self._tk_variables['weather_state_option'].set(
-                WEATHER_STATES[self.config.weather]['name']
+            self._tk_variables.weather_state_option.set(
+                _WEATHER_NAMES[self.config.weather]
             )
         else:
-            self._tk_variables['weather_state_option'].set('Clear')
-        weather_states = WEATHER_STATES_REVERSE.keys()
+            self._tk_variables.weather_state_option.set('Clear')
         weather_state_option = tkinter.ttk.OptionMenu(
             weather_state_frame,
-            self._tk_variables['weather_state_option'],
-            self._tk_variables['weather_state_option'].get(),
-            *weather_states,
+            self._tk_variables.weather_state_option,
+            self._tk_variables.weather_state_option.get(),
+            *_WEATHER_OPTIONS,
             style='custom.TButton',
             command=self._set_alert_sound,
         )
@@ -337,30 +382,30 @@ class WindowManager(object):
             text='Sunrise: ',
             name='sunrise_label'
         )
-        self._tk_variables['sunrise_hour_option'] = tkinter.StringVar()
+        self._tk_variables.sunrise_hour_option = tkinter.StringVar()
         if self.config.sunrise and ':' in self.config.sunrise:
             sunrise_hour, sunrise_minute  = self.config.sunrise.split(':')
         else:
             sunrise_hour = 0
             sunrise_minute = 0
-        self._tk_variables['sunrise_hour_option'].set(sunrise_hour)
+        self._tk_variables.sunrise_hour_option.set(sunrise_hour)
         sunrise_hour_option = tkinter.ttk.OptionMenu(
             sunrise_frame,
-            self._tk_variables['sunrise_hour_option'],
-            self._tk_variables['sunrise_hour_option'].get(),
-            *hours,
+            self._tk_variables.sunrise_hour_option,
+            self._tk_variables.sunrise_hour_option.get(),
+            *_HOURS,
             style='custom.TButton',
             command=self._set_alert_sound,
         )
         sunrise_hour_option.config(width=2)
         sunrise_colon_label = tkinter.Label(sunrise_frame, text=':', name='sunrise_colon_label')
-        self._tk_variables['sunrise_minute_option'] = tkinter.StringVar()
-        self._tk_variables['sunrise_minute_option'].set(sunrise_minute)
+        self._tk_variables.sunrise_minute_option = tkinter.StringVar()
+        self._tk_variables.sunrise_minute_option.set(sunrise_minute)
         sunrise_minute_option = tkinter.ttk.OptionMenu(
             sunrise_frame,
-            self._tk_variables['sunrise_minute_option'],
-            self._tk_variables['sunrise_minute_option'].get(),
-            *minutes,
+            self._tk_variables.sunrise_minute_option,
+            self._tk_variables.sunrise_minute_option.get(),
+            *_MINUTES,
             style='custom.TButton',
             command=self._set_alert_sound
         )
@@ -372,30 +417,30 @@ class WindowManager(object):
             text='Sunset: ',
             name='sunset_label'
         )
-        self._tk_variables['sunset_hour_option'] = tkinter.StringVar()
+        self._tk_variables.sunset_hour_option = tkinter.StringVar()
         if self.config.sunset and ':' in self.config.sunset:
             sunset_hour, sunset_minute  = self.config.sunset.split(':')
         else:
             sunset_hour = 0
             sunset_minute = 0
-        self._tk_variables['sunset_hour_option'].set(sunset_hour)
+        self._tk_variables.sunset_hour_option.set(sunset_hour)
         sunset_hour_option = tkinter.ttk.OptionMenu(
             sunset_frame,
-            self._tk_variables['sunset_hour_option'],
-            self._tk_variables['sunset_hour_option'].get(),
-            *hours,
+            self._tk_variables.sunset_hour_option,
+            self._tk_variables.sunset_hour_option.get(),
+            *_HOURS,
             style='custom.TButton',
             command=self._set_alert_sound,
         )
         sunset_hour_option.config(width=2)
         sunset_colon_label = tkinter.Label(sunset_frame, text=':', name='sunset_colon_label')
-        self._tk_variables['sunset_minute_option'] = tkinter.StringVar()
-        self._tk_variables['sunset_minute_option'].set(sunset_minute)
+        self._tk_variables.sunset_minute_option = tkinter.StringVar()
+        self._tk_variables.sunset_minute_option.set(sunset_minute)
         sunset_minute_option = tkinter.ttk.OptionMenu(
             sunset_frame,
-            self._tk_variables['sunset_minute_option'],
-            self._tk_variables['sunset_minute_option'].get(),
-            *minutes,
+            self._tk_variables.sunset_minute_option,
+            self._tk_variables.sunset_minute_option.get(),
+            *_MINUTES,
             style='custom.TButton',
             command=self._set_alert_sound,
         )
@@ -413,84 +458,27 @@ class WindowManager(object):
         max_temp_label = tkinter.Label(
             more_info_frame, text=f'Max °{self.config.temp_scale}: ??', name='max_temp_label'
         )
-        weather_state_icon = tkinter.PhotoImage(file=self._imgs[f"c.gif"])
         weather_state_label = tkinter.Label(
             more_info_frame, text='Current Weather: ??', name='weather_state_label',
-            image=weather_state_icon, compound=tkinter.RIGHT
+            image=self._tk_imgs[_ICON_DEFAULT_WEATHER], compound=tkinter.RIGHT
         )
-        sun_state_icon = tkinter.PhotoImage(file=self._imgs[f"At Apex.gif"])
         sun_state_label = tkinter.Label(
             more_info_frame, text='Sun Status: ??', name='sun_state_label',
-            image=sun_state_icon, compound=tkinter.RIGHT
+            image=self._tk_imgs[_ICON_DEFAULT_SUN], compound=tkinter.RIGHT
         )
         boktai_meter_frame = tkinter.Frame(simulator_frame, width=274, name='boktai_meter_frame')
-        self._image_containers['bt1meter_bg'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai1_meter_empty.jpg"],
-            version=1,
-            parent=boktai_meter_frame,
-            name='boktai1_meter_bg',
-            container_type='Canvas',
-            width=270,
-            height=51
-        )
-        self._image_containers['bt1meter_fg'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai1_meter_full.jpg"],
-            version=1,
-            parent=boktai_meter_frame,
-            name='boktai1_meter_fg',
-            container_type='Canvas',
-            width=0,
-            height=51
-        )
-        self._image_containers['bt2meter_bg'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai2_meter_empty.jpg"],
-            version=2,
-            parent=boktai_meter_frame,
-            name='boktai2_meter_bg',
-            container_type='Canvas',
-            width=280,
-            height=51
-        )
-        self._image_containers['bt2meter_fg'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai2_meter_full.jpg"],
-            version=2,
-            parent=boktai_meter_frame,
-            name='boktai2_meter_fg',
-            container_type='Canvas',
-            width=0,
-            height=51
-        )
-        self._image_containers['bt3meter_bg'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai3_meter_empty.jpg"],
-            version=3,
-            parent=boktai_meter_frame,
-            name='boktai3_meter_bg',
-            container_type='Canvas',
-            width=280,
-            height=51
-        )
-        self._image_containers['bt3meter_fg'] = ImageHandler.from_file(
-            file_path=self._imgs["boktai3_meter_full.jpg"],
-            version=3,
-            parent=boktai_meter_frame,
-            name='boktai3_meter_fg',
-            container_type='Canvas',
-            width=0,
-            height=51
-        )
-
         ui_update_frame = tkinter.Frame(options_frame, name='ui_update_frame')
         ui_update_timer_header = tkinter.Label(
             ui_update_frame, text='UI Update Interval (Minutes)', name='ui_update_timer_header'
         )
-        self._tk_variables['gui_update_interval'] = tkinter.IntVar()
+        self._tk_variables.gui_update_interval = tkinter.IntVar()
         ui_update_timer_slider = tkinter.Scale(
             ui_update_frame, from_=0, to=30, tickinterval=5, orient=tkinter.HORIZONTAL, length=150,
             command=self._wrap_option('gui_update_interval'),
-            variable=self._tk_variables['gui_update_interval'],
+            variable=self._tk_variables.gui_update_interval,
             name='gui_update_interval'
         )
-        self._tk_variables['gui_update_interval'].set(round(self.config.gui_update_interval / 60))
+        self._tk_variables.gui_update_interval.set(round(self.config.gui_update_interval / 60))
         ui_update_timer_label = tkinter.Label(
             ui_update_frame, text='0 = Disable \nAutomatic UI Updates', name='ui_update_timer_label'
         )
@@ -499,70 +487,67 @@ class WindowManager(object):
         api_update_timer_header = tkinter.Label(
             api_update_frame, text='API Update Interval (Minutes)', name='api_update_timer_header'
         )
-        self._tk_variables['api_update_interval'] = tkinter.IntVar()
+        self._tk_variables.api_update_interval = tkinter.IntVar()
         api_update_timer_slider = tkinter.Scale(
             api_update_frame, from_=0, to=60, tickinterval=10, orient=tkinter.HORIZONTAL,
             length=150,
             resolution=5,
             command=self._wrap_option('api_update_interval'),
-            variable=self._tk_variables['api_update_interval'],
+            variable=self._tk_variables.api_update_interval,
             name='api_update_interval'
         )
-        self._tk_variables['api_update_interval'].set(round(self.config.api_update_interval / 60))
+        self._tk_variables.api_update_interval.set(round(self.config.api_update_interval / 60))
         api_update_timer_label = tkinter.Label(
             api_update_frame, text='0 = Disable \nAutomatic API Updates',
             name='api_update_timer_label'
         )
         api_update_mute_separator = tkinter.ttk.Separator(options_frame)
-        self._tk_variables['mute_flavor_sounds'] = tkinter.IntVar()
+        self._tk_variables.mute_flavor_sounds = tkinter.IntVar()
         if self.config.mute_flavor_sounds:
-            self._tk_variables['mute_flavor_sounds'].set(1)
+            self._tk_variables.mute_flavor_sounds.set(1)
         mute_frame = tkinter.Frame(options_frame, name='mute_frame')
         mute_flavor_checkbutton = tkinter.ttk.Checkbutton(
             mute_frame,
             text='Mute Flavor Sounds',
             command=self._wrap_option('mute_flavor_sounds'),
-            variable=self._tk_variables['mute_flavor_sounds'],
+            variable=self._tk_variables.mute_flavor_sounds,
             style='custom.TCheckbutton',
             name='mute_flavor_sounds'
         )
         alert_sound_label = tkinter.Label(
             mute_frame, text='Alert Sound: ', name='alert_sound_label'
         )
-        self._tk_variables['alert_sound_option'] = tkinter.StringVar()
+        self._tk_variables.alert_sound_option = tkinter.StringVar()
         if self.config.alert_sound_option:
-            self._tk_variables['alert_sound_option'].set(self.config.alert_sound_option)
+            self._tk_variables.alert_sound_option.set(self.config.alert_sound_option)
         alert_sound_option = tkinter.ttk.OptionMenu(
             mute_frame,
-            self._tk_variables['alert_sound_option'],
-            self._tk_variables['alert_sound_option'].get(),
-            'chime1',
-            'chime2',
-            'boktai',
-            'taiyou',
+            self._tk_variables.alert_sound_option,
+            self._tk_variables.alert_sound_option.get(),
+            *_ALERT_SOUND_OPTIONS,
             style='custom.TButton',
             command=self._set_alert_sound,
         )
-        self._tk_variables['mute_alert_sounds'] = tkinter.IntVar()
+        self._tk_variables.mute_alert_sounds = tkinter.IntVar()
         if self.config.mute_alert_sounds:
-            self._tk_variables['mute_alert_sounds'].set(1)
+            self._tk_variables.mute_alert_sounds.set(1)
         mute_alert_checkbutton = tkinter.ttk.Checkbutton(
             mute_frame,
             text='Mute Alert Sounds',
             command=self._wrap_option('mute_alert_sounds'),
-            variable=self._tk_variables['mute_alert_sounds'],
+            variable=self._tk_variables.mute_alert_sounds,
             style='custom.TCheckbutton',
             name='mute_alert_sounds'
         )
         mute_lunar_mode_separator = tkinter.ttk.Separator(options_frame)
-        self._tk_variables['lunar_mode'] = tkinter.IntVar()
+        self._tk_variables.lunar_mode = tkinter.IntVar()
         if self.config.lunar_mode:
-            self._tk_variables['lunar_mode'].set(1)
+            self._tk_variables.lunar_mode.set(1)
         lunar_mode_checkbutton = tkinter.ttk.Checkbutton(
             options_frame,
             text='Enable Lunar Mode*',
             command=self._wrap_option('lunar_mode'),
-            variable=self._tk_variables['lunar_mode'],
+            variable=self._tk_variables.lunar_mode,
             style='custom.TCheckbutton',
             name='lunar_mode'
         )
@@ -574,28 +559,29 @@ class WindowManager(object):
         )
         lunar_mode_theme_separator = tkinter.ttk.Separator(options_frame)
         theme_picker_frame = tkinter.Frame(options_frame, name='theme_picker_frame')
-        self._tk_variables['theme'] = tkinter.StringVar()
+        self._tk_variables.theme = tkinter.StringVar()
         if self.config.theme:
-            self._tk_variables['theme'].set(self.config.theme)
+            self._tk_variables.theme.set(self.config.theme)
         theme_label = tkinter.Label(theme_picker_frame, text='Theme: ', name='theme_label')
-        themes_available = tkinter.ttk.Style().theme_names()
+        if self._themes_available is None:
+            self._themes_available = style.theme_names()
         theme_option = tkinter.ttk.OptionMenu(
-            theme_picker_frame, self._tk_variables['theme'],
-            self._tk_variables['theme'].get(), *themes_available,
+            theme_picker_frame, self._tk_variables.theme,
+            self._tk_variables.theme.get(), *self._themes_available,
             style='custom.TButton',
             command=self._update_theme
         )
         temp_scale_frame = tkinter.Frame(
             theme_picker_frame, name='temp_scale_frame'
         )
-        self._tk_variables['temp_scale'] = tkinter.StringVar()
+        self._tk_variables.temp_scale = tkinter.StringVar()
         if self.config.temp_scale:
-            self._tk_variables['temp_scale'].set(self.config.temp_scale)
+            self._tk_variables.temp_scale.set(self.config.temp_scale)
         fahrenheit_radio = tkinter.ttk.Radiobutton(
             temp_scale_frame,
             text='Fahrenheit',
             command=self._update_temp_scale,
-            variable=self._tk_variables['temp_scale'],
+            variable=self._tk_variables.temp_scale,
             value='F',
             style='custom.TRadiobutton',
             name='fahrenheit_radio'
@@ -604,23 +590,23 @@ class WindowManager(object):
             temp_scale_frame,
             text='Celsius',
             command=self._update_temp_scale,
-            variable=self._tk_variables['temp_scale'],
+            variable=self._tk_variables.temp_scale,
             value='C',
             style='custom.TRadiobutton',
             name='celsuis_radio'
         )
         theme_logging_separator = tkinter.ttk.Separator(options_frame)
         logging_level_frame = tkinter.Frame(options_frame, name='logging_level_frame')
-        self._tk_variables['logging_level'] = tkinter.StringVar()
+        self._tk_variables.logging_level = tkinter.StringVar()
         if self.config.theme:
-            self._tk_variables['logging_level'].set(self.config.logging_level)
+            self._tk_variables.logging_level.set(self.config.logging_level)
         logging_level_label = tkinter.Label(
             logging_level_frame, text='Logging Level:', name='logging_level_label'
         )
         logging_level_option = tkinter.ttk.OptionMenu(
             logging_level_frame,
-            self._tk_variables['logging_level'],
-            self._tk_variables['logging_level'].get(),
+            self._tk_variables.logging_level,
+            self._tk_variables.logging_level.get(),
             'CRITICAL',
             'ERROR',
             'WARNING',
@@ -630,9 +616,6 @@ class WindowManager(object):
             command=self._update_logging_level
         )
 
-        if self.config.lunar_mode:
-            self._tk_variables['lunar_mode'].set(1)
-
         about_button = tkinter.ttk.Button(
             self.window,
             text='About',
@@ -642,181 +625,152 @@ class WindowManager(object):
         )
         bottom_frame = tkinter.Frame(self.window)
 
-        self.window.columnconfigure(0, weight=1)
-        self.window.rowconfigure(0, weight=1)
-        master_notebook.grid(column=0, row=0, sticky=tkinter.NSEW, padx=(5, 5), pady=(5, 5))
-        master_notebook.columnconfigure(0, weight=1)
-        master_notebook.rowconfigure(0, weight=1)
-        area_notebook.grid(column=0, row=6, columnspan=8, sticky=tkinter.NSEW, padx=(30, 30))
-        area_notebook.columnconfigure(0, weight=1)
-        area_notebook.rowconfigure(0, weight=1)
-        simulator_frame.columnconfigure(0, weight=1)
-        simulator_frame.columnconfigure(1, weight=1)
-        simulator_frame.columnconfigure(2, weight=1)
-        simulator_frame.columnconfigure(3, weight=1)
-        simulator_frame.columnconfigure(4, weight=1)
-        simulator_frame.columnconfigure(5, weight=1)
-        simulator_frame.rowconfigure(0, weight=1)
-        simulator_frame.rowconfigure(1, weight=1)
-        simulator_frame.rowconfigure(2, weight=1)
-        simulator_frame.rowconfigure(3, weight=1)
-        simulator_frame.rowconfigure(4, weight=1)
-        simulator_frame.rowconfigure(5, weight=1)
-        version_and_submit_frame.grid(column=0, row=1, columnspan=8, padx=(15, 15))
-        version_label.grid(column=0, row=0)
-        version_combo.grid(column=1, row=0, padx=(0, 15))
-        button.grid(column=3, row=0, padx=(15, 15))
-        zipcode_frame.columnconfigure(0, weight=1)
-        zipcode_frame.columnconfigure(1, weight=1)
-        zipcode_frame.rowconfigure(0, weight=1)
-        zipcode_frame.rowconfigure(1, weight=1)
         zipcode_frame.bind('<Visibility>', self._tab_switch)
-        zipcode_label.grid(column=0, row=0, sticky=tkinter.E)
-        zipcode_entry.grid(column=1, row=0, sticky=tkinter.W)
-        zipcode_note_label.grid(column=0, row=1, columnspan=2, sticky=tkinter.N)
-        latlon_frame.columnconfigure(0, weight=1)
-        latlon_frame.columnconfigure(1, weight=1)
-        latlon_frame.columnconfigure(2, weight=1)
-        latlon_frame.columnconfigure(3, weight=1)
-        latlon_frame.rowconfigure(0, weight=1)
-        latlon_frame.rowconfigure(1, weight=1)
         latlon_frame.bind('<Visibility>', self._tab_switch)
-        lat_label.grid(column=0, row=0, sticky=tkinter.E)
-        lat_entry.grid(column=1, row=0, sticky=tkinter.W)
-        lon_label.grid(column=2, row=0, sticky=tkinter.E)
-        lon_entry.grid(column=3, row=0, sticky=tkinter.W)
-        latlon_note_label.grid(column=0, row=1, columnspan=4, sticky=tkinter.N)
+        manual_frame.bind('<Visibility>', self._tab_switch)
         latlon_note_label.bind(
             '<Button-1>',
             self._wrap_launch('https://www.latlong.net/')
         )
-        manual_frame.columnconfigure(0, weight=1)
-        manual_frame.columnconfigure(1, weight=1)
-        manual_frame.columnconfigure(2, weight=1)
-        manual_frame.columnconfigure(3, weight=1)
-        manual_frame.columnconfigure(4, weight=1)
-        manual_frame.columnconfigure(5, weight=1)
-        manual_frame.bind('<Visibility>', self._tab_switch)
-        min_f_label.grid(column=0, row=0, sticky=tkinter.E)
-        min_f_entry.grid(column=1, row=0, sticky=tkinter.W)
-        avg_f_label.grid(column=2, row=0, sticky=tkinter.E)
-        avg_f_entry.grid(column=3, row=0, sticky=tkinter.W)
-        max_f_label.grid(column=4, row=0, sticky=tkinter.E)
-        max_f_entry.grid(column=5, row=0, sticky=tkinter.W)
-        sunrise_frame.grid(column=0, row=1, columnspan=3, sticky=tkinter.E, padx=(5, 5))
-        sunrise_label.grid(column=0, row=0, sticky=tkinter.E)
-        sunrise_hour_option.grid(column=1, row=0, sticky=tkinter.E)
-        sunrise_colon_label.grid(column=2, row=0)
-        sunrise_minute_option.grid(column=3, row=0, sticky=tkinter.W)
-        sunset_frame.grid(column=3, row=1, columnspan=3, sticky=tkinter.W, padx=(5, 5))
-        sunset_label.grid(column=0, row=0, sticky=tkinter.E)
-        sunset_hour_option.grid(column=1, row=0, sticky=tkinter.E)
-        sunset_colon_label.grid(column=2, row=0)
-        sunset_minute_option.grid(column=3, row=0, sticky=tkinter.W)
-        weather_state_frame.grid(column=0, row=2, columnspan=6)
-        weather_state_entry_label.grid(column=0, row=0, sticky=tkinter.NSEW)
-        weather_state_option.grid(column=1, row=0, sticky=tkinter.NSEW)
-
-        middle_spacing_label.grid(column=0, row=2)
-        for version in (1, 2, 3):
-            self._image_containers[f'bt{version}_logo'].container.grid(
-                column=0, row=2, columnspan=8
-            )
-            if self.config.version != version:
-                self._image_containers[f'bt{version}_logo'].container.grid_remove()
-        boktai_meter_frame.grid(column=0, row=3, columnspan=8)
-        self._image_containers['bt1meter_bg'].container.grid(
-            column=0, row=4, columnspan=8, sticky=tkinter.EW
-        )
-        self._image_containers['bt1meter_bg'].create_image(0, 0, anchor=tkinter.NW)
-        self._image_containers['bt1meter_fg'].container.grid(
-            column=0, row=4, columnspan=8, sticky=tkinter.EW
-        )
-        self._image_containers['bt1meter_fg'].create_image(0, 0, anchor=tkinter.NW)
-        self._image_containers['bt1meter_fg'].container.grid_remove()
-        if self.config.version != 1:
-            self._image_containers['bt1meter_bg'].container.grid_remove()
-        self._image_containers['bt2meter_bg'].container.grid(
-            column=0, row=4, columnspan=8, sticky=tkinter.EW
-        )
-        self._image_containers['bt2meter_bg'].create_image(0, 0, anchor=tkinter.NW)
-        self._image_containers['bt2meter_fg'].container.grid(
-            column=0, row=4, columnspan=8, sticky=tkinter.EW
-        )
-        self._image_containers['bt2meter_fg'].create_image(0, 0, anchor=tkinter.NW)
-        self._image_containers['bt2meter_fg'].container.grid_remove()
-        if self.config.version != 2:
-            self._image_containers['bt2meter_bg'].container.grid_remove()
-        self._image_containers['bt3meter_bg'].container.grid(
-            column=0, row=4, columnspan=8, sticky=tkinter.EW
-        )
-        self._image_containers['bt3meter_bg'].create_image(0, 0, anchor=tkinter.NW)
-        self._image_containers['bt3meter_fg'].container.grid(
-            column=0, row=4, columnspan=8, sticky=tkinter.EW
-        )
-        self._image_containers['bt3meter_fg'].create_image(0, 0, anchor=tkinter.NW)
-        self._image_containers['bt3meter_fg'].container.grid_remove()
-        if self.config.version != 3:
-            self._image_containers['bt3meter_bg'].container.grid_remove()
-        more_info_frame.grid(column=0, row=5, columnspan=8)
-        location_label.grid(column=0, row=0, columnspan=5)
-        min_temp_label.grid(column=0, row=1)
-        current_temp_label.grid(column=1, row=1)
-        max_temp_label.grid(column=2, row=1)
-        weather_state_label.grid(column=0, row=2, columnspan=3)
-        sun_state_label.grid(column=0, row=3, columnspan=3)
-
-        options_frame.grid_columnconfigure(0, weight=1)
-        ui_update_frame.grid(column=0, row=0, columnspan=2, padx=(10, 10))
-        ui_update_timer_header.grid(column=0, row=0, columnspan=2)
-        ui_update_timer_slider.grid(column=0, row=1)
-        ui_update_timer_label.grid(column=1, row=1)
-        ui_adi_update_separator.grid(column=0, row=1, columnspan=2, sticky=tkinter.EW, pady=(5, 5))
-        api_update_frame.grid(column=0, row=2, columnspan=2, padx=(10, 10))
-        api_update_timer_header.grid(column=0, row=0, columnspan=2)
-        api_update_timer_slider.grid(column=0, row=1)
-        api_update_timer_label.grid(column=1, row=1)
-        api_update_mute_separator.grid(
-            column=0, row=3, columnspan=2, sticky=tkinter.EW, pady=(5, 5)
-        )
-        mute_frame.grid(column=0, row=4, columnspan=2, padx=(10, 10))
-        mute_flavor_checkbutton.grid(column=0, row=0, columnspan=2, padx=(5, 5))
-        mute_alert_checkbutton.grid(column=2, row=0, columnspan=2, padx=(5, 5))
-        alert_sound_label.grid(column=0, row=1, columnspan=2, sticky=tkinter.E)
-        alert_sound_option.grid(column=2, row=1, columnspan=2, sticky=tkinter.W)
-        mute_lunar_mode_separator.grid(
-            column=0, row=5, columnspan=2, sticky=tkinter.EW, pady=(5, 5)
-        )
-        lunar_mode_checkbutton.grid(column=0, row=6, columnspan=2)
-        lunar_mode_notes_label.grid(column=0, row=7, columnspan=2)
-        lunar_mode_theme_separator.grid(
-            column=0, row=8, columnspan=2, sticky=tkinter.EW, pady=(5, 5)
-        )
-        theme_picker_frame.grid(column=0, row=9, columnspan=2, padx=(10, 10))
-        theme_label.grid(column=0, row=0)
-        theme_option.grid(column=1, row=0)
-        temp_scale_frame.grid(column=2, row=0, columnspan=2, padx=(10, 10))
-        fahrenheit_radio.grid(column=0, row=0, sticky=tkinter.W)
-        celsuis_radio.grid(column=1, row=0, sticky=tkinter.E)
-        theme_logging_separator.grid(column=0, row=10, columnspan=2, sticky=tkinter.EW, pady=(5, 5))
-        logging_level_frame.grid(column=0, row=11, columnspan=2, padx=(10, 10))
-        logging_level_label.grid(column=0, row=0, sticky=tkinter.E)
-        logging_level_option.grid(column=1, row=0, sticky=tkinter.W)
-
-        logging_frame.columnconfigure(0, weight=1)
-        logging_frame.rowconfigure(0, weight=1)
-        logging_text.grid(column=0, row=0, sticky=tkinter.NSEW)
-        logging_vertical_scroll.grid(column=1, row=0, sticky=tkinter.NS)
-        logging_horizontal_scroll.grid(column=0, row=1, sticky=tkinter.EW)
-
-        about_button.grid(column=0, row=1)
-        bottom_frame.grid(column=0, row=2, sticky=tkinter.E)
+        self._bulk_grid(
+            [
+                (
+                    master_notebook,
+                    dict(column=0, row=0, sticky=tkinter.NSEW, padx=(5, 5), pady=(5, 5))
+                ),
+                (
+                    area_notebook,
+                    dict(column=0, row=6, columnspan=8, sticky=tkinter.NSEW, padx=(30, 30))
+                ),
+                (version_and_submit_frame, dict(column=0, row=1, columnspan=8, padx=(15, 15))),
+                (version_label, dict(column=0, row=0)),
+                (version_combo, dict(column=1, row=0, padx=(0, 15))),
+                (button, dict(column=3, row=0, padx=(15, 15))),
+                (zipcode_label, dict(column=0, row=0, sticky=tkinter.E)),
+                (zipcode_entry, dict(column=1, row=0, sticky=tkinter.W)),
+                (zipcode_note_label, dict(column=0, row=1, columnspan=2, sticky=tkinter.N)),
+                (lat_label, dict(column=0, row=0, sticky=tkinter.E)),
+                (lat_entry, dict(column=1, row=0, sticky=tkinter.W)),
+                (lon_label, dict(column=2, row=0, sticky=tkinter.E)),
+                (lon_entry, dict(column=3, row=0, sticky=tkinter.W)),
+                (latlon_note_label, dict(column=0, row=1, columnspan=4, sticky=tkinter.N)),
+                (min_f_label, dict(column=0, row=0, sticky=tkinter.E)),
+                (min_f_entry, dict(column=1, row=0, sticky=tkinter.W)),
+                (avg_f_label, dict(column=2, row=0, sticky=tkinter.E)),
+                (avg_f_entry, dict(column=3, row=0, sticky=tkinter.W)),
+                (max_f_label, dict(column=4, row=0, sticky=tkinter.E)),
+                (max_f_entry, dict(column=5, row=0, sticky=tkinter.W)),
+                (sunrise_frame, dict(column=0, row=1, columnspan=3, sticky=tkinter.E, padx=(5, 5))),
+                (sunrise_label, dict(column=0, row=0, sticky=tkinter.E)),
+                (sunrise_hour_option, dict(column=1, row=0, sticky=tkinter.E)),
+                (sunrise_colon_label, dict(column=2, row=0)),
+                (sunrise_minute_option, dict(column=3, row=0, sticky=tkinter.W)),
+                (sunset_frame, dict(column=3, row=1, columnspan=3, sticky=tkinter.W, padx=(5, 5))),
+                (sunset_label, dict(column=0, row=0, sticky=tkinter.E)),
+                (sunset_hour_option, dict(column=1, row=0, sticky=tkinter.E)),
+                (sunset_colon_label, dict(column=2, row=0)),
+                (sunset_minute_option, dict(column=3, row=0, sticky=tkinter.W)),
+                (weather_state_frame, dict(column=0, row=2, columnspan=6)),
+                (weather_state_entry_label, dict(column=0, row=0, sticky=tkinter.NSEW)),
+                (weather_state_option, dict(column=1, row=0, sticky=tkinter.NSEW)),
+                (middle_spacing_label, dict(column=0, row=2)),
+                (boktai_meter_frame, dict(column=0, row=3, columnspan=8)),
+                (more_info_frame, dict(column=0, row=5, columnspan=8)),
+                (location_label, dict(column=0, row=0, columnspan=5)),
+                (min_temp_label, dict(column=0, row=1)),
+                (current_temp_label, dict(column=1, row=1)),
+                (max_temp_label, dict(column=2, row=1)),
+                (weather_state_label, dict(column=0, row=2, columnspan=3)),
+                (sun_state_label, dict(column=0, row=3, columnspan=3))
+            ],
+            [
+                (self.window, 'column', 0, 1),
+                (self.window, 'row', 0, 1),
+                (master_notebook, 'column', 0, 1),
+                (master_notebook, 'row', 0, 1),
+                (area_notebook, 'column', 0, 1),
+                (area_notebook, 'row', 0, 1),
+                *((simulator_frame, 'column', index, 1) for index in range(6)),
+                *((simulator_frame, 'row', index, 1) for index in range(6)),
+                *((zipcode_frame, 'column', index, 1) for index in range(2)),
+                *((zipcode_frame, 'row', index, 1) for index in range(2)),
+                *((latlon_frame, 'column', index, 1) for index in range(4)),
+                *((latlon_frame, 'row', index, 1) for index in range(2)),
+                *((manual_frame, 'column', index, 1) for index in range(6))
+            ]
+        )
+
+        self._bulk_grid(
+            [
+                (ui_update_frame, dict(column=0, row=0, columnspan=2, padx=(10, 10))),
+                (ui_update_timer_header, dict(column=0, row=0, columnspan=2)),
+                (ui_update_timer_slider, dict(column=0, row=1)),
+                (ui_update_timer_label, dict(column=1, row=1)),
+                (
+                    ui_adi_update_separator,
+                    dict(column=0, row=1, columnspan=2, sticky=tkinter.EW, pady=(5, 5))
+                ),
+                (api_update_frame, dict(column=0, row=2, columnspan=2, padx=(10, 10))),
+                (api_update_timer_header, dict(column=0, row=0, columnspan=2)),
+                (api_update_timer_slider, dict(column=0, row=1)),
+                (api_update_timer_label, dict(column=1, row=1)),
+                (
+                    api_update_mute_separator,
+                    dict(column=0, row=3, columnspan=2, sticky=tkinter.EW, pady=(5, 5))
+                ),
+                (mute_frame, dict(column=0, row=4, columnspan=2, padx=(10, 10))),
+                (mute_flavor_checkbutton, dict(column=0, row=0, columnspan=2, padx=(5, 5))),
+                (mute_alert_checkbutton, dict(column=2, row=0, columnspan=2, padx=(5, 5))),
+                (alert_sound_label, dict(column=0, row=1, columnspan=2, sticky=tkinter.E)),
+                (alert_sound_option, dict(column=2, row=1, columnspan=2, sticky=tkinter.W)),
+                (
+                    mute_lunar_mode_separator,
+                    dict(column=0, row=5, columnspan=2, sticky=tkinter.EW, pady=(5, 5))
+                ),
+                (lunar_mode_checkbutton, dict(column=0, row=6, columnspan=2)),
+                (lunar_mode_notes_label, dict(column=0, row=7, columnspan=2)),
+                (
+                    lunar_mode_theme_separator,
+                    dict(column=0, row=8, columnspan=2, sticky=tkinter.EW, pady=(5, 5))
+                ),
+                (theme_picker_frame, dict(column=0, row=9, columnspan=2, padx=(10, 10))),
+                (theme_label, dict(column=0, row=0)),
+                (theme_option, dict(column=1, row=0)),
+                (temp_scale_frame, dict(column=2, row=0, columnspan=2, padx=(10, 10))),
+                (fahrenheit_radio, dict(column=0, row=0, sticky=tkinter.W)),
+                (celsuis_radio, dict(column=1, row=0, sticky=tkinter.E)),
+                (
+                    theme_logging_separator,
+                    dict(column=0, row=10, columnspan=2, sticky=tkinter.EW, pady=(5, 5))
+                ),
+                (logging_level_frame, dict(column=0, row=11, columnspan=2, padx=(10, 10))),
+                (logging_level_label, dict(column=0, row=0, sticky=tkinter.E)),
+                (logging_level_option, dict(column=1, row=0, sticky=tkinter.W)),
+                (logging_text, dict(column=0, row=0, sticky=tkinter.NSEW)),
+                (logging_vertical_scroll, dict(column=1, row=0, sticky=tkinter.NS)),
+                (logging_horizontal_scroll, dict(column=0, row=1, sticky=tkinter.EW)),
+                (about_button, dict(column=0, row=1)),
+                (bottom_frame, dict(column=0, row=2, sticky=tkinter.E))
+            ],
+            [
+                (options_frame, 'column', 0, 1),
+                (logging_frame, 'column', 0, 1),
+                (logging_frame, 'row', 0, 1)
+            ]
+        )
         self._widget_dict = self.build_widget_dict(self.window)
+        # Widgets read on every update get attribute access instead of a name lookup
+        for name in _BOUND_WIDGETS:
+            setattr(self, f'_w_{name}', self._widget_dict[name])
+        self._build_version_images(self.config.version)
+        self._image_containers[f'bt{self.config.version}_logo'].container.grid()
+        self._image_containers[f'bt{self.config.version}meter_bg'].container.grid()
+        self._gridded_version = self.config.version
         for _, widget in self._widget_dict.items():
             if isinstance(widget, tkinter.Entry):
                 continue
             try:
-                widget.configure(bg='#ECECEC', highlightbackground='#ECECEC')
+                widget.configure(**_BG_KWARGS)
             except tkinter.TclError:
                 pass
         self.play_sound('open')
@@ -830,34 +784,100 @@ class WindowManager(object):
                 area_notebook.select(manual_frame)
         self.window.mainloop()
 
+    def _build_version_images(self, version: int) -> None:
+        """ Creates the logo and meter containers for a Boktai version, hidden, if not yet built """
+        if f'bt{version}_logo' in self._image_containers:
+            return
+        meter_width = 270 if version == 1 else 280
+        logo = ImageHandler.from_file(
+            file_path=self._imgs[f"boktai{version}_logo.gif"],
+            version=version,
+            parent=self._widget_dict['simulator_frame'],
+            name=f'boktai{version}_logo',
+            container_type='Label'
+        )
+        meter_bg = ImageHandler.from_file(
+            file_path=self._imgs[f"boktai{version}_meter_empty.jpg"],
+            version=version,
+            parent=self._widget_dict['boktai_meter_frame'],
+            name=f'boktai{version}_meter_bg',
+            container_type='Canvas',
+            width=meter_width,
+            height=51
+        )
+        meter_fg = ImageHandler.from_file(
+            file_path=self._imgs[f"boktai{version}_meter_full.jpg"],
+            version=version,
+            parent=self._widget_dict['boktai_meter_frame'],
+            name=f'boktai{version}_meter_fg',
+            container_type='Canvas',
+            width=0,
+            height=51
+        )
+        logo.container.grid(column=0, row=2, columnspan=8)
+        meter_bg.container.grid(column=0, row=4, columnspan=8, sticky=tkinter.EW)
+        meter_bg.create_image(0, 0, anchor=tkinter.NW)
+        meter_fg.container.grid(column=0, row=4, columnspan=8, sticky=tkinter.EW)
+        meter_fg.create_image(0, 0, anchor=tkinter.NW)
+        for image_container in (logo, meter_bg, meter_fg):
+            image_container.container.grid_remove()
+            self._widget_dict[image_container.name] = image_container.container
+        self._image_containers[f'bt{version}_logo'] = logo
+        self._image_containers[f'bt{version}meter_bg'] = meter_bg
+        self._image_containers[f'bt{version}meter_fg'] = meter_fg
+
+    def _bulk_grid(
+            self,
+            grid_specs: List[Tuple[tkinter.Misc, Dict[str, Any]]],
+            weight_specs: Optional[List[Tuple[tkinter.Misc, str, int, int]]] = None
+    ) -> None:
+        """ Grids widgets and sets row/column weights in a single Tcl evaluation """
+        commands = []
+        for master, axis, index, weight in weight_specs or []:
+            commands.append(f'grid {axis}configure {master._w} {index} -weight {weight}')
+        for widget, options in grid_specs:
+            tcl_options = ' '.join(
+                f'-{option} {_tcl_value(value)}' for option, value in options.items()
+            )
+            commands.append(f'grid configure {widget._w} {tcl_options}')
+        self.window.tk.eval('\n'.join(commands))
+
     @staticmethod
     def build_widget_dict(
-            tk_widget: Union[tkinter.BaseWidget, tkinter.Tk]
+            tk_widget: Union[tkinter.BaseWidget, tkinter.Tk],
+            widget_dict: Optional[Dict[str, tkinter.BaseWidget]] = None
     ) -> Dict[str, tkinter.BaseWidget]:
         """ Recursively provides a dict of tkinter widgets, ignoring ones without explicit names """
-        widget_dict = {}
-        if not tk_widget.children:
-            return {'.': tk_widget}
+        if widget_dict is None:
+            if not tk_widget.children:
+                return {'.': tk_widget}
+            widget_dict = {}
         for name, widget in tk_widget.children.items():
             if name.startswith('!'):
                 continue
-            if widget.children:
-                inner_dict = WindowManager.build_widget_dict(widget)
-                widget_dict[name] = widget
-                widget_dict = {**widget_dict, **inner_dict}
-                continue
             widget_dict[name] = widget
+            if widget.children:
+                WindowManager.build_widget_dict(widget, widget_dict)
         return widget_dict
 
     def on_close(self, event: Optional[tkinter.Event] = None) -> None:
         if event:
             self.logger.debug(f'Received event {event}')
         self.logger.info('Quitting')
+        # Any debounced save still pending would be dropped with the window, so save it here
+        if self._save_after_id:
+            self.window.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._save_thread:
+            self._save_thread.join()
+        self._locked_save()
         self.play_sound('close')
+        if self._fetch_executor:
+            self._fetch_executor.shutdown(wait=False)
         self.window.destroy()
         time.sleep(3)
 
-    def do_update(self, event: Optional[tkinter.Event] = None) -> None:
+    def do_update(self, event: Optional[tkinter.Event] = None, timed: bool = False) -> None:
         if event:
             self.logger.debug(f'Received event {event}')
         self.logger.debug('Performing update')
@@ -865,226 +885,250 @@ class WindowManager(object):
             self._first_update = False
             self.timed_update()
             return
-        self.config.version = int(self._widget_dict['version_combo'].get())
+        self.config.version = int(self._w_version_combo.get())
         if not 0 < self.config.version < 4:
             self.alert('warning', 'Boktai version must be between 1 and 3.')
             return
+        self._build_version_images(self.config.version)
         update_logo = False
         if (self.boktaisim and self._last_version != self.version) or \
                 (not self.boktaisim):
             update_logo = True
             self._last_version = self.version
-        notebook = self._widget_dict['area_notebook']
+        notebook = self._w_area_notebook
         current_location_tab = notebook.tab(notebook.select(), "text")
-        latlong = None
-        manual_weather = None
-        if current_location_tab == 'Zipcode':
-            try:
-                self.config.zipcode = int(
-                    self._widget_dict['zipcode_entry'].get()
-                )
-            except ValueError:
-                self.alert('warning', 'No zipcode provided.')
-                return
-            try:
-                latlong = zip_to_latlong(self.config.zipcode)
-            except KeyError:
-                self.alert('warning', 'Invalid zipcode provided.')
-                return
-        elif current_location_tab == 'Lat/Lon':
-            try:
-                float(self._widget_dict['lat_entry'].get())
-                float(self._widget_dict['lon_entry'].get())
-            except ValueError:
-                self.alert('warning', 'Invalid latitude and longitude provided.')
-                return
-            self.config.lat = self._widget_dict['lat_entry'].get()
-            self.config.lon = self._widget_dict['lon_entry'].get()
-            latlong = f'{self.config.lat},{self.config.lon}'
-        elif current_location_tab == 'Manual':
-            if not (self._widget_dict['min_f_entry'].get() and
-                    self._widget_dict['avg_f_entry'].get() and
-                    self._widget_dict['max_f_entry'].get()):
-                self.alert('warning', 'All fields must be filled when in Manual mode!')
-                return
-            if self.config.temp_scale == 'C':
-                try:
-                    self.config.min_f = c_to_f(self._widget_dict['min_f_entry'].get())
-                    self.config.avg_f = c_to_f(self._widget_dict['avg_f_entry'].get())
-                    self.config.max_f = c_to_f(self._widget_dict['max_f_entry'].get())
-                except ValueError:
-                    self.alert('warning',
-                               'Temperature range values must be whole or decimal numbers.')
-                    return
+        # Only the API tabs share the fetch worker, Manual never waits on it
+        if current_location_tab != 'Manual' and self._fetch_in_flight:
+            if timed:
+                self.logger.info('API request still running, skipping timed update')
             else:
-                try:
-                    self.config.min_f = float(self._widget_dict['min_f_entry'].get())
-                    self.config.avg_f = float(self._widget_dict['avg_f_entry'].get())
-                    self.config.max_f = float(self._widget_dict['max_f_entry'].get())
-                except ValueError:
-                    self.alert('warning',
-                               'Temperature range values must be whole or decimal numbers.')
-                    return
-            if not self.config.min_f <= self.config.avg_f <= self.config.max_f:
-                self.alert('warning', 'Temperature values do not make sense!')
-                return
-            try:
-                self.config.weather = \
-                    WEATHER_STATES_REVERSE[self._tk_variables['weather_state_option'].get()]
-            except KeyError:
-                self.alert('warning', 'Invalid weather state provided.')
-                return
-            try:
-                sunrise_hour = int(self._tk_variables['sunrise_hour_option'].get())
-                sunrise_minute = int(self._tk_variables['sunrise_minute_option'].get())
-                sunset_hour = int(self._tk_variables['sunset_hour_option'].get())
-                sunset_minute = int(self._tk_variables['sunset_minute_option'].get())
-            except ValueError:
-                self.alert('warning', 'Invalid time provided')
-                return
-            self.config.sunrise = f'{sunrise_hour}:{sunrise_minute}'
-            self.config.sunset = f'{sunset_hour}:{sunset_minute}'
-            current_datetime = datetime.datetime.now(tz=LOCAL_TIMEZONE)
-            sunrise_datetime = current_datetime.replace(hour=sunrise_hour, minute=sunrise_minute)
-            sunset_datetime = current_datetime.replace(hour=sunset_hour, minute=sunset_minute)
-            if sunset_datetime < sunrise_datetime:
-                self.alert('warning', 'Sunset must come after sunrise.')
-                return
-            latlong = 'manual'
-            city = 'Noplace'
-            if self.config.version == 1:
-                city = 'Istrakan'
-            elif self.config.version == 2 or self.config.version == 3:
-                city = 'San Miguel'
-
-            min_temp_val = round(f_to_c(self.config.min_f), 2)
-            avg_temp_val = round(f_to_c(self.config.avg_f), 2)
-            max_temp_val = round(f_to_c(self.config.max_f), 2)
-            current_temp_val = round(f_to_c(self.config.avg_f), 2)
-
-            manual_weather = WeatherInfo(
-                state='World of Boktai',
-                city=city,
-                latlong=latlong,
-                woeid='0',
-                min_temp=min_temp_val,
-                max_temp=max_temp_val,
-                current_temp=current_temp_val,
-                visibility=0,
-                weather_state=self.config.weather,
-                sunrise=sunrise_datetime.strftime('%Y-%m-%dT%H:%M:%S.%f%z'),
-                sunset=sunset_datetime.strftime('%Y-%m-%dT%H:%M:%S.%f%z'),
-                timestamp=current_datetime.strftime('%Y-%m-%dT%H:%M:%S.%f%Z'),
-                avg_temp=avg_temp_val,
-                manual=True
-            )
-            self.boktaisim = BoktaiSim(manual_data=manual_weather, parent=self)
-
-        if latlong not in self._sim_dict and current_location_tab != 'Manual':
-            if current_location_tab == 'Zipcode':
-                try:
-                    self.boktaisim = BoktaiSim(zipcode=self.config.zipcode, parent=self)
-                except KeyError:
-                    self.alert('warning', 'Invalid zipcode provided.')
-                    return
-                except requests.ConnectionError as e:
-                    self.alert(
-                        'Warning',
-                        'Can not connect to API! Only manual mode is available.\n'
-                        'More info:\n\n'
-                        f'{e}'
-                    )
-                    return
-            elif current_location_tab == 'Lat/Lon' and current_location_tab != 'Manual':
-                try:
-                    self.boktaisim = BoktaiSim(latlon=latlong, parent=self)
-                except requests.ConnectionError as e:
-                    self.alert(
-                        'warning',
-                        'Can not connect to API! Only manual mode is available.\n'
-                        'More info:\n\n'
-                        f'{e}'
-                    )
-                    return
-            self._sim_dict[latlong] = self.boktaisim
-        elif current_location_tab == 'Manual':
-            self.boktaisim = BoktaiSim(manual_data=manual_weather, parent=self)
-            self._sim_dict[latlong] = self.boktaisim
+                self.alert('info', 'Still waiting on the weather API, try again in a moment.')
+            return
+        parsed = self._tab_parsers[current_location_tab]()
+        if not parsed:
+            return
+        key, source = parsed
+        if current_location_tab == 'Manual':
+            if source is not None:
+                self._manual_sim = (key, BoktaiSim(manual_data=source, parent=self))
+            self.boktaisim = self._manual_sim[1]
+        elif key not in self._sim_dict:
+            self._submit_fetch(current_location_tab, source, key, update_logo)
+            return
         else:
-            self.boktaisim = self._sim_dict[latlong]
+            self.boktaisim = self._sim_dict[key]
             if self.boktaisim.weather.data_age() > self.config.api_update_interval:
-                try:
-                    self.boktaisim.weather.update_om()
-                except Exception as e:
-                    self.alert(
-                        'warning',
-                        'Can not connect to API! Only manual mode is available.\n'
-                        'More info:\n\n'
-                        f'{e}'
-                    )
-                    return
-        self._widget_dict['location_label'].configure(
-            text=f'{self.boktaisim.weather.city}, {self.boktaisim.weather.state}'
-        )
+                self._submit_fetch('refresh', self.boktaisim, key, update_logo)
+                return
+        self._apply_sim(update_logo)
+
+    def _parse_zipcode(self) -> Optional[Tuple[str, int]]:
+        """ Reads the Zipcode tab, returning the sim cache key and the zipcode to fetch """
+        try:
+            self.config.zipcode = int(self._w_zipcode_entry.get())
+        except ValueError:
+            self.alert('warning', 'No zipcode provided.')
+            return None
+        try:
+            latlong = zip_to_latlong(self.config.zipcode)
+        except KeyError:
+            self.alert('warning', 'Invalid zipcode provided.')
+            return None
+        return latlong, self.config.zipcode
+
+    def _parse_latlon(self) -> Optional[Tuple[str, str]]:
+        """ Reads the Lat/Lon tab, returning the sim cache key and the coordinates to fetch """
+        try:
+            float(self._w_lat_entry.get())
+            float(self._w_lon_entry.get())
+        except ValueError:
+            self.alert('warning', 'Invalid latitude and longitude provided.')
+            return None
+        self.config.lat = self._w_lat_entry.get()
+        self.config.lon = self._w_lon_entry.get()
+        latlong = f'{self.config.lat},{self.config.lon}'
+        return latlong, latlong
+
+    def _parse_manual(self) -> Optional[Tuple[Tuple[Any, ...], Optional[WeatherInfo]]]:
+        """
+        Reads the Manual tab, returning the sim cache key and the weather to simulate, which is
+        None when the last Manual sim was built from identical inputs
+        """
+        if not (self._w_min_f_entry.get() and
+                self._w_avg_f_entry.get() and
+                self._w_max_f_entry.get()):
+            self.alert('warning', 'All fields must be filled when in Manual mode!')
+            return None
+        try:
+            entered = [
+                float(entry.get())
+                for entry in (self._w_min_f_entry, self._w_avg_f_entry, self._w_max_f_entry)
+            ]
+        except ValueError:
+            self.alert('warning', 'Temperature range values must be whole or decimal numbers.')
+            return None
+        # Convert exactly once: WeatherInfo wants Celsius, the config keeps Fahrenheit
         if self.config.temp_scale == 'C':
-            self._widget_dict['min_temp_label'].configure(
-                text=f'Min °C: {self.boktaisim.weather.min_temp}'
-            )
-            self._widget_dict['current_temp_label'].configure(
-                text=f'Current °C: {self.boktaisim.weather.current_temp}'
-            )
-            self._widget_dict['max_temp_label'].configure(
-                text=f'Max °C: {self.boktaisim.weather.max_temp}'
-            )
-            self._widget_dict['min_f_label'].configure(
-                text=f'Min °C: '
-            )
-            self._widget_dict['avg_f_label'].configure(
-                text=f'Avg °C: '
-            )
-            self._widget_dict['max_f_label'].configure(
-                text=f'Max °C: '
-            )
+            temps_c = entered
+            self.config.min_f, self.config.avg_f, self.config.max_f = map(c_to_f, entered)
         else:
-            self._widget_dict['min_temp_label'].configure(
-                text=f'Min °F: {self.boktaisim.weather.min_temp_f}'
-            )
-            self._widget_dict['current_temp_label'].configure(
-                text=f'Current °F: {self.boktaisim.weather.current_temp_f}'
-            )
-            self._widget_dict['max_temp_label'].configure(
-                text=f'Max °F: {self.boktaisim.weather.max_temp_f}'
+            temps_c = [f_to_c(temp) for temp in entered]
+            self.config.min_f, self.config.avg_f, self.config.max_f = entered
+        if not temps_c[0] <= temps_c[1] <= temps_c[2]:
+            self.alert('warning', 'Temperature values do not make sense!')
+            return None
+        try:
+            self.config.weather = \
+                WEATHER_STATES_REVERSE[self._tk_variables.weather_state_option.get()]
+        except KeyError:
+            self.alert('warning', 'Invalid weather state provided.')
+            return None
+        try:
+            sunrise_hour = int(self._tk_variables.sunrise_hour_option.get())
+            sunrise_minute = int(self._tk_variables.sunrise_minute_option.get())
+            sunset_hour = int(self._tk_variables.sunset_hour_option.get())
+            sunset_minute = int(self._tk_variables.sunset_minute_option.get())
+        except ValueError:
+            self.alert('warning', 'Invalid time provided')
+            return None
+        self.config.sunrise = f'{sunrise_hour}:{sunrise_minute}'
+        self.config.sunset = f'{sunset_hour}:{sunset_minute}'
+        current_datetime = datetime.datetime.now(tz=LOCAL_TIMEZONE)
+        sunrise_datetime = current_datetime.replace(hour=sunrise_hour, minute=sunrise_minute)
+        sunset_datetime = current_datetime.replace(hour=sunset_hour, minute=sunset_minute)
+        if sunset_datetime < sunrise_datetime:
+            self.alert('warning', 'Sunset must come after sunrise.')
+            return None
+        latlong = 'manual'
+        city = 'Noplace'
+        if self.config.version == 1:
+            city = 'Istrakan'
+        elif self.config.version == 2 or self.config.version == 3:
+            city = 'San Miguel'
+
+        min_temp_val, avg_temp_val, max_temp_val = (round(temp, 2) for temp in temps_c)
+        # The date is part of the key since sunrise and sunset are pinned to the current day
+        key = (
+            latlong, city, min_temp_val, avg_temp_val, max_temp_val, self.config.weather,
+            self.config.sunrise, self.config.sunset, current_datetime.date()
+        )
+        if self._manual_sim and self._manual_sim[0] == key:
+            return key, None
+
+        manual_weather = WeatherInfo(
+            state='World of Boktai',
+            city=city,
+            latlong=latlong,
+            woeid='0',
+            min_temp=min_temp_val,
+            max_temp=max_temp_val,
+            current_temp=avg_temp_val,
+            visibility=0,
+            weather_state=self.config.weather,
+            sunrise=sunrise_datetime,
+            sunset=sunset_datetime,
+            timestamp=current_datetime,
+            avg_temp=avg_temp_val,
+            manual=True
+        )
+        return key, manual_weather
+
+    def _submit_fetch(self, kind: str, arg: Any, key: str, update_logo: bool) -> None:
+        """ Runs an API-bound BoktaiSim build or refresh on the fetch worker """
+        if not self._fetch_executor:
+            self._fetch_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='boktaisim_fetch'
             )
-            self._widget_dict['min_f_label'].configure(
-                text=f'Min °F: '
-            )
-            self._widget_dict['avg_f_label'].configure(
-                text=f'Avg °F: '
-            )
-            self._widget_dict['max_f_label'].configure(
-                text=f'Max °F: '
+        self._fetch_in_flight = True
+        future = self._fetch_executor.submit(self._fetch_sim, kind, arg)
+        future.add_done_callback(
+            functools.partial(self._on_fetch_done, kind, key, update_logo)
+        )
+        self.window.after(50, self._poll_fetch)
+
+    def _fetch_sim(self, kind: str, arg: Any) -> BoktaiSim:
+        # Called on the fetch worker, must not touch any Tk widget
+        if kind == 'Zipcode':
+            return BoktaiSim(zipcode=arg, parent=self)
+        if kind == 'Lat/Lon':
+            return BoktaiSim(latlon=arg, parent=self)
+        arg.weather.update_om()
+        return arg
+
+    def _on_fetch_done(
+            self,
+            kind: str,
+            key: str,
+            update_logo: bool,
+            future: concurrent.futures.Future
+    ) -> None:
+        # Runs on the fetch worker, so it must not touch Tk. The result is handed over, and
+        # _poll_fetch picks it up on the Tk thread
+        self._fetch_results.put((kind, key, update_logo, future))
+
+    def _poll_fetch(self) -> None:
+        # Records the worker logged wait in the handler until the Tk thread drains them
+        self._drain_log()
+        try:
+            result = self._fetch_results.get_nowait()
+        except queue.Empty:
+            self.window.after(50, self._poll_fetch)
+            return
+        self._finish_fetch(*result)
+
+    def _finish_fetch(
+            self,
+            kind: str,
+            key: str,
+            update_logo: bool,
+            future: concurrent.futures.Future
+    ) -> None:
+        import requests
+
+        self._fetch_in_flight = False
+        error = future.exception()
+        if isinstance(error, KeyError) and kind == 'Zipcode':
+            self.alert('warning', 'Invalid zipcode provided.')
+            return
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)) or \
+                (error and kind == 'refresh'):
+            self.alert(
+                'warning',
+                'Can not connect to API! Only manual mode is available.\n'
+                'More info:\n\n'
+                f'{error}'
             )
-        weather_image = tkinter.PhotoImage(
-            file=self._imgs[f'{self.boktaisim.weather.weather_state}.gif']
-        )
-        self._widget_dict['weather_state_label'].configure(
-            text=f'Current Weather: {WEATHER_STATES[self.boktaisim.weather.weather_state]["name"]}',
-            image=weather_image
+            return
+        # Re-raises anything unexpected from the worker
+        boktaisim = future.result()
+        self._sim_dict[key] = boktaisim
+        # A Manual sim may have been shown while this was in flight, don't replace it
+        notebook = self._w_area_notebook
+        if notebook.tab(notebook.select(), "text") == 'Manual':
+            return
+        self.boktaisim = boktaisim
+        self._apply_sim(update_logo)
+
+    def _apply_sim(self, update_logo: bool) -> None:
+        self._set_text(
+            'location_label', f'{self.boktaisim.weather.city}, {self.boktaisim.weather.state}'
         )
-        self._widget_dict['weather_state_label'].image = weather_image
-        sun_image = tkinter.PhotoImage(
-            file=self._imgs[f'{self.boktaisim.weather.sun_state}.gif']
+        self._update_temp_labels()
+        weather_state = self.boktaisim.weather.weather_state
+        self._set_text(
+            'weather_state_label',
+            f'Current Weather: {_WEATHER_NAMES[weather_state]}',
+            image=self._tk_imgs[f'{weather_state}.gif']
         )
-        self._widget_dict['sun_state_label'].configure(
-            text=f'Sun Status: {self.boktaisim.weather.sun_state}',
-            image=sun_image
+        sun_state = self.boktaisim.weather.sun_state
+        self._set_text(
+            'sun_state_label', f'Sun Status: {sun_state}', image=self._tk_imgs[f'{sun_state}.gif']
         )
-        self._widget_dict['sun_state_label'].image = sun_image
         if update_logo:
-            for i in [1, 2, 3]:
-                self._widget_dict[f'boktai{i}_logo'].grid_remove()
-                self._widget_dict[f'boktai{i}_meter_bg'].grid_remove()
-                self._widget_dict[f'boktai{i}_meter_fg'].grid_remove()
+            previous = self._gridded_version
+            if previous is not None and previous != self.config.version:
+                for name in ('logo', 'meter_bg', 'meter_fg'):
+                    self._widget_dict[f'boktai{previous}_{name}'].grid_remove()
             self._widget_dict[f'boktai{self.config.version}_logo'].grid(
                 column=0, row=2, columnspan=8
             )
@@ -1094,9 +1138,61 @@ class WindowManager(object):
             self._widget_dict[f'boktai{self.config.version}_meter_fg'].grid(
                 column=0, row=4, columnspan=4, padx=45, sticky=tkinter.W
             )
+            self._gridded_version = self.config.version
         self._update_bar(True)
         self._update_logo()
-        self.config.save()
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """ Coalesces config saves into one trailing write shortly after the last change """
+        if self._save_after_id:
+            return
+        self._save_after_id = self.window.after(500, self._flush_save)
+
+    def _flush_save(self) -> None:
+        self._save_after_id = None
+        self._save_thread = threading.Thread(target=self._locked_save, name='config_save')
+        self._save_thread.start()
+        self.window.after(50, self._poll_save)
+
+    def _poll_save(self) -> None:
+        self._drain_log()
+        if self._save_thread and self._save_thread.is_alive():
+            self.window.after(50, self._poll_save)
+
+    def _drain_log(self) -> None:
+        if self._text_handler:
+            self._text_handler.drain()
+
+    def _locked_save(self) -> None:
+        # Only one writer at a time, whether from a flush thread or on_close
+        with self._save_lock:
+            self.config.save()
+
+    def _update_temp_labels(self) -> None:
+        """ Renders the temperature readouts and the Manual entry captions in the current scale """
+        self._update_temp_captions()
+        weather = self.boktaisim.weather
+        if self.config.temp_scale == 'C':
+            values = (weather.min_temp, weather.current_temp, weather.max_temp)
+        else:
+            values = (weather.min_temp_f, weather.current_temp_f, weather.max_temp_f)
+        labels = _TEMP_LABELS[self.config.temp_scale]
+        for key, value in zip(('min', 'current', 'max'), values):
+            self._set_text(f'{key}_temp_label', labels[key].format(value))
+
+    def _update_temp_captions(self) -> None:
+        """ Renders the Manual entry captions, which don't depend on a sim, in the current scale """
+        labels = _TEMP_LABELS[self.config.temp_scale]
+        for key in ('min', 'avg', 'max'):
+            self._set_text(f'{key}_f_label', labels[key].format(''))
+
+    def _set_text(self, widget_name: str, text: str, **kwargs) -> None:
+        """ Configures a widget's text (and anything tied to it), skipping unchanged values """
+        if self._last_rendered.get(widget_name) == text:
+            return
+        self._widget_dict[widget_name].configure(text=text, **kwargs)
+        self._last_rendered[widget_name] = text
 
     def alert(self, level: str, msg: str) -> None:
         self.play_sound(level)
@@ -1105,45 +1201,39 @@ class WindowManager(object):
 
     def timed_update(self) -> None:
         self.logger.info('Performing timed update')
-        self.do_update()
+        self.do_update(timed=True)
         self.window.after(self.config.gui_update_interval * 1000, self.timed_update)
 
     def play_sound(self, sound: str) -> None:
-        if sound not in self._sound_dict:
-            return
-        if self.config.mute_alert_sounds and self._sound_dict[sound]['type'] == 'alert':
-            return
-        if self.config.mute_flavor_sounds and self._sound_dict[sound]['type'] == 'flavor':
-            return
-        if self._sound_dict[sound]['segment']:
-            logging.debug(f'Playing sound `{sound}`')
+        segment = self._playable.get(sound)
+        if segment:
+            self.logger.debug(f'Playing sound `{sound}`')
             try:
-                self._sound_dict[sound]['segment'].play()
+                segment.play()
             except:
                 pass
 
     def about_window(self) -> None:
         about_window = tkinter.Toplevel(self.window)
         about_window.resizable(False, False)
-        about_window.configure(bg='#ECECEC')
+        about_window.configure(bg=_BG_KWARGS['bg'])
         about_window.title('About boktaisim')
         title_label = tkinter.Label(
             about_window, text='Solar Sensor Simulator\nfor the\nBoktai Trilogy',
-            bg='#ECECEC', highlightbackground='#ECECEC', font=("TkDefaultFont", 24, "bold")
+            **_BG_KWARGS, font=("TkDefaultFont", 24, "bold")
         )
-        otenko_img = tkinter.PhotoImage(file=self._imgs["Solar_Sensor_Icon.gif"])
         otenko_logo = tkinter.Label(
-            about_window, image=otenko_img, bg='#ECECEC', highlightbackground='#ECECEC',
+            about_window, image=self._tk_imgs['Solar_Sensor_Icon.gif'], **_BG_KWARGS,
             name='otenko_logo'
         )
         version_label = tkinter.Label(
             about_window, text=f'Version {__version__}', fg="gray33", font=("TkDefaultFont", 10),
-            bg='#ECECEC', highlightbackground='#ECECEC'
+            **_BG_KWARGS
         )
         more_info_frame = tkinter.Frame(about_window, border=3, relief='ridge')
         credits_idea_pre = tkinter.Label(more_info_frame, text='Idea by Nathan Stiles of')
         credits_idea_post = tkinter.Label(
-            more_info_frame, text=f'Stiles\' Reviews', fg="blue", cursor=self._link_cursor
+            more_info_frame, text='Stiles\' Reviews', fg="blue", cursor=self._link_cursor
         )
         credits_coding_pre = tkinter.Label(more_info_frame, text='Original code by')
         credits_coding_post = tkinter.Label(
@@ -1186,24 +1276,22 @@ class WindowManager(object):
         )
         close_button.grid(row=4, column=0)
         self.play_sound('about')
-        about_window.mainloop()
 
-    @staticmethod
-    def _wrap_launch(url: str):
+    def _wrap_launch(self, url: str):
         def _launch_browser(event: Optional[tkinter.Event] = None):
             if event:
-                logging.debug(f'Received event {event}')
+                self.logger.debug(f'Received event {event}')
             webbrowser.open(url=url)
         return _launch_browser
 
     def _wrap_option(self, widget_label: str, option_label: Optional[str] = None):
         def _option_setter(event: Optional[tkinter.Event] = None):
             if event:
-                logging.debug(f'Received event {event}')
+                self.logger.debug(f'Received event {event}')
             if option_label:
-                value = self._tk_variables[option_label].get()
+                value = getattr(self._tk_variables, option_label).get()
             else:
-                value = self._tk_variables[widget_label].get()
+                value = getattr(self._tk_variables, widget_label).get()
             if isinstance(self._widget_dict[widget_label], tkinter.ttk.Checkbutton):
                 if value == 0:
                     self.config.__dict__[widget_label] = False
@@ -1216,7 +1304,9 @@ class WindowManager(object):
                 self.config.__dict__[option_label] = value
             else:
                 self.config.__dict__[widget_label] = self._widget_dict[widget_label].get()
-            self.config.save()
+            if widget_label in ('mute_alert_sounds', 'mute_flavor_sounds'):
+                self._refresh_playable()
+            self._schedule_save()
         return _option_setter
 
     def _update_bar(self, update_value: bool = False) -> None:
@@ -1313,6 +1403,7 @@ class WindowManager(object):
         caption_font_height = round(starting_sizes[1] * win_height / 100)
         self._main_font['size'] = main_font_height
         self._caption_font['size'] = caption_font_height
+        font_tuple = ('TkDefaultFont', main_font_height)
         for label, widget in self._widget_dict.items():
             if (
                     isinstance(widget, tkinter.Label) or
@@ -1331,19 +1422,19 @@ class WindowManager(object):
                 style = tkinter.ttk.Style()
                 style.configure(
                     'custom.TButton',
-                    font=('TkDefaultFont', main_font_height)
+                    font=font_tuple
                 )
             if isinstance(widget, tkinter.ttk.Radiobutton):
                 style = tkinter.ttk.Style()
                 style.configure(
                     'custom.TRadiobutton',
-                    font=('TkDefaultFont', main_font_height)
+                    font=font_tuple
                 )
             if isinstance(widget, tkinter.ttk.Checkbutton):
                 style = tkinter.ttk.Style()
                 style.configure(
                     'custom.TCheckbutton',
-                    font=('TkDefaultFont', main_font_height)
+                    font=font_tuple
                 )
             if isinstance(widget, tkinter.ttk.Combobox):
                 sized_font = font.Font(self.window, family='TkDefaultFont', size=main_font_height)
@@ -1356,12 +1447,12 @@ class WindowManager(object):
                 style = tkinter.ttk.Style()
                 style.configure(
                     'custom.TNotebook.Tab',
-                    font=('TkDefaultFont', main_font_height)
+                    font=font_tuple
                 )
                 style = tkinter.ttk.Style()
                 style.configure(
                     'centered.TNotebook.Tab',
-                    font=('TkDefaultFont', main_font_height)
+                    font=font_tuple
                 )
                 style.configure(
                     'centered.TNotebook',
@@ -1371,99 +1462,33 @@ class WindowManager(object):
     def _tab_switch(self, event: Optional[tkinter.Event] = None) -> None:
         if event:
             self.logger.debug(f'Received event {event}')
-        area_notebook = self._widget_dict['area_notebook']
+        area_notebook = self._w_area_notebook
         self.config.area_type = area_notebook.tab(area_notebook.select(), 'text')
-        self.config.save()
+        self._schedule_save()
 
     def _update_temp_scale(self, event: Optional[tkinter.Event] = None) -> None:
         if event:
             self.logger.debug(f'Received event {event}')
-        if self.config.temp_scale != self._tk_variables['temp_scale'].get():
-            if not self.boktaisim:
-                return
-            self.config.temp_scale = self._tk_variables['temp_scale'].get()
-            if self.config.temp_scale == 'C':
-                self._widget_dict['min_temp_label'].configure(
-                    text=f'Min °C: {self.boktaisim.weather.min_temp}'
-                )
-                self._widget_dict['current_temp_label'].configure(
-                    text=f'Current °C: {self.boktaisim.weather.current_temp}'
-                )
-                self._widget_dict['max_temp_label'].configure(
-                    text=f'Max °C: {self.boktaisim.weather.max_temp}'
-                )
-                self._widget_dict['min_f_label'].configure(
-                    text=f'Min °C: '
-                )
-                self._widget_dict['avg_f_label'].configure(
-                    text=f'Avg °C: '
-                )
-                self._widget_dict['max_f_label'].configure(
-                    text=f'Max °C: '
-                )
-            else:
-                self._widget_dict['min_temp_label'].configure(
-                    text=f'Min °F: {self.boktaisim.weather.min_temp_f}'
-                )
-                self._widget_dict['current_temp_label'].configure(
-                    text=f'Current °F: {self.boktaisim.weather.current_temp_f}'
-                )
-                self._widget_dict['max_temp_label'].configure(
-                    text=f'Max °F: {self.boktaisim.weather.max_temp_f}'
-                )
-                self._widget_dict['min_f_label'].configure(
-                    text=f'Min °F: '
-                )
-                self._widget_dict['avg_f_label'].configure(
-                    text=f'Avg °F: '
-                )
-                self._widget_dict['max_f_label'].configure(
-                    text=f'Max °F: '
-                )
-            if self.config.temp_scale == 'F':
-                if self._widget_dict['min_f_entry'].get():
-                    min_f = round(c_to_f(self._widget_dict['min_f_entry'].get()), 2)
-                    self._widget_dict['min_f_entry'].delete(0, tkinter.END)
-                    self._widget_dict['min_f_entry'].insert(
-                        0, min_f
-                    )
-                if self._widget_dict['avg_f_entry'].get():
-                    avg_f = round(c_to_f(self._widget_dict['avg_f_entry'].get()), 2)
-                    self._widget_dict['avg_f_entry'].delete(0, tkinter.END)
-                    self._widget_dict['avg_f_entry'].insert(
-                        0, avg_f
-                    )
-                if self._widget_dict['max_f_entry'].get():
-                    max_f = round(c_to_f(self._widget_dict['max_f_entry'].get()), 2)
-                    self._widget_dict['max_f_entry'].delete(0, tkinter.END)
-                    self._widget_dict['max_f_entry'].insert(
-                        0, max_f
-                    )
-            if self.config.temp_scale == 'C':
-                if self._widget_dict['min_f_entry'].get():
-                    min_f = round(f_to_c(self._widget_dict['min_f_entry'].get()), 2)
-                    self._widget_dict['min_f_entry'].delete(0, tkinter.END)
-                    self._widget_dict['min_f_entry'].insert(
-                        0, min_f
-                    )
-                if self._widget_dict['avg_f_entry'].get():
-                    avg_f = round(f_to_c(self._widget_dict['avg_f_entry'].get()), 2)
-                    self._widget_dict['avg_f_entry'].delete(0, tkinter.END)
-                    self._widget_dict['avg_f_entry'].insert(
-                        0, avg_f
-                    )
-                if self._widget_dict['max_f_entry'].get():
-                    max_f = round(f_to_c(self._widget_dict['max_f_entry'].get()), 2)
-                    self._widget_dict['max_f_entry'].delete(0, tkinter.END)
-                    self._widget_dict['max_f_entry'].insert(
-                        0, max_f
-                    )
+        new_scale = self._tk_variables.temp_scale.get()
+        if self.config.temp_scale == new_scale:
+            return
+        convert = c_to_f if new_scale == 'F' else f_to_c
+        self.config.temp_scale = new_scale
+        if self.boktaisim:
+            self._update_temp_labels()
+        else:
+            self._update_temp_captions()
+        for entry in (self._w_min_f_entry, self._w_avg_f_entry, self._w_max_f_entry):
+            if entry.get():
+                value = round(convert(entry.get()), 2)
+                entry.delete(0, tkinter.END)
+                entry.insert(0, value)
 
     def _update_theme(self, event: Optional[tkinter.Event] = None) -> None:
         if event:
             self.logger.debug(f'Received event {event}')
-        tkinter.ttk.Style().theme_use(self._tk_variables['theme'].get())
-        self.config.theme = self._tk_variables['theme'].get()
+        tkinter.ttk.Style().theme_use(self._tk_variables.theme.get())
+        self.config.theme = self._tk_variables.theme.get()
         """ VERY hacky way of doing this, should probably fix it in teh future. """
         event = tkinter.Event()
         event.__dict__['widget'] = self.window
@@ -1472,35 +1497,30 @@ class WindowManager(object):
         event.__dict__['_theme_switch'] = True
         self._resize_window(event)
         self.logger.debug(f'Updating theme to `{self.config.theme}`')
-        self.config.save()
+        self._schedule_save()
 
     def _update_logging_level(self, event: Optional[tkinter.Event] = None) -> None:
         if event:
             self.logger.debug(f'Received event {event}')
-        logging_level = self._tk_variables['logging_level'].get()
+        logging_level = self._tk_variables.logging_level.get()
         if logging_level != self.config.logging_level:
             self.logger.debug(f'Setting log level to `{logging_level}`')
             self.logger.setLevel(logging.getLevelName(logging_level))
         self.logger.info(f'Updating theme to `{self.config.theme}`')
         self.config.logging_level = logging_level
-        self.config.save()
+        self._schedule_save()
 
     def _set_alert_sound(self, event: Optional[tkinter.Event] = None) -> None:
         if event:
             self.logger.debug(f'Received event {event}')
-        selection = self._tk_variables["alert_sound_option"].get()
-        if BOKTAI_STATE[0:2] == ('windows', 'frozen'):
-            audio_segment = simpleaudio.WaveObject.from_wave_file(f'resources/{selection}.wav')
-            self._sound_dict['bar_update']['segment'] = audio_segment
-            self._sound_dict['bar_update']['file'] = f'resources/{selection}.wav'
-        else:
-            with pkg_resources.path('boktaisim.resources', f'{selection}.wav') as sound_path:
-                audio_segment = simpleaudio.WaveObject.from_wave_file(str(sound_path))
-                self._sound_dict['bar_update']['segment'] = audio_segment
-                self._sound_dict['bar_update']['file'] = f'{selection}.wav'
-        self.play_sound('bar_update')
+        selection = self._tk_variables.alert_sound_option.get()
         self.config.alert_sound_option = selection
-        self.config.save()
+        if self._sound_dict:
+            self._sound_dict['bar_update']['file'] = f'{selection}.wav'
+            self._sound_dict['bar_update']['segment'] = _load_wave(f'{selection}.wav')
+            self._refresh_playable()
+        self.play_sound('bar_update')
+        self._schedule_save()
 
     @property
     def min_temp(self) -> Optional[float]:
@@ -1572,12 +1592,12 @@ class ImageHandler(object):
         tkimage = ImageTk.PhotoImage(image)
         if container_type == 'Canvas':
             container = tkinter.Canvas(
-                parent, *args, bg='#ECECEC', highlightbackground='#ECECEC', borderwidth=0,
+                parent, *args, **_BG_KWARGS, borderwidth=0,
                 highlightthickness=0, name=name, **kwargs
             )
         elif container_type == 'Label':
             container = tkinter.Label(
-                parent, *args, bg='#ECECEC', highlightbackground='#ECECEC', borderwidth=0,
+                parent, *args, **_BG_KWARGS, borderwidth=0,
                 highlightthickness=0, name=name, **kwargs
             )
         else:
@@ -1603,29 +1623,51 @@ class ImageHandler(object):
 class TextHandler(logging.Handler):
     """This class allows you to log to a Tkinter Text or ScrolledText widget"""
 
+    _LEVEL_TAGS = {
+        logging.DEBUG: 'DEBUG',
+        logging.INFO: 'INFO',
+        logging.WARNING: 'WARNING',
+        logging.ERROR: 'ERROR',
+        logging.CRITICAL: 'CRITICAL'
+    }
+    # Oldest lines are trimmed past this, Text rendering slows down as it grows
+    _MAX_LINES = 5000
+
     def __init__(self, text) -> None:
         # run the regular Handler __init__
         logging.Handler.__init__(self)
         # Store a reference to the Text it will log to
         self.text = text
+        # Records waiting to be written, drained in one batch per Tk idle cycle
+        self._queue = collections.deque()
+        self._pending = False
+        self._line_count = 0
 
     def emit(self, record) -> None:
-        msg = self.format(record)
-
-        def append():
-            self.text.configure(state='normal')
-            tag = 'INFO'
-            if 'DEBUG' in msg:
-                tag = 'DEBUG'
-            if 'WARNING' in msg:
-                tag = 'WARNING'
-            if 'ERROR' in msg:
-                tag = 'ERROR'
-            if 'CRITICAL' in msg:
-                tag = 'CRITICAL'
+        tag = self._LEVEL_TAGS.get(record.levelno, 'INFO')
+        self._queue.append((tag, self.format(record)))
+        # Tk may only be called from the main thread, records from other threads wait until the
+        # owner of that thread calls drain
+        if threading.current_thread() is not threading.main_thread():
+            return
+        if not self._pending:
+            self._pending = True
+            self.text.after(0, self.drain)
+
+    def drain(self) -> None:
+        """ Writes every waiting record to the Text, must be called on the Tk thread """
+        self._pending = False
+        if not self._queue:
+            return
+        self.text.configure(state='normal')
+        while self._queue:
+            tag, msg = self._queue.popleft()
             self.text.insert(tkinter.END, msg + '\n', tag)
-            self.text.configure(state='disabled')
-            # Auto-scroll to the bottom
-            self.text.yview(tkinter.END)
-        # This is necessary because we can't modify the Text from other threads
-        self.text.after(0, append)
+            self._line_count += msg.count('\n') + 1
+        if self._line_count > self._MAX_LINES:
+            excess = self._line_count - self._MAX_LINES
+            self.text.delete('1.0', f'{excess + 1}.0')
+            self._line_count = self._MAX_LINES
+        self.text.configure(state='disabled')
+        # Auto-scroll to the bottom
+        self.text.yview(tkinter.END)
@@ -1,17 +1,43 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import functools
+import itertools
+import multiprocessing
+import os
+import random
+from typing import TYPE_CHECKING
 import unittest
 
 from .classes import BoktaiSim, WeatherInfo
 from .constants import WEATHER_STATES
 
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider
-from matplotlib.ticker import AutoMinorLocator
+# numpy, numba and matplotlib come from the 'tests' extra and are imported where they're used, so
+# importing this module never needs them (the frozen apps exclude them)
+if TYPE_CHECKING:
+    import numpy as np
+
+# Bar offset general_test applies to the weighted total for each weather state
+_STATE_OFFSETS = {'h': -2, 't': -2, 'hr': -1, 'hc': -1, 'lc': 1, 's': 1, 'c': 1}
+# Below this many samples per worker, process startup and pickling the sim cost more than sampling
+_MIN_WORKER_SAMPLES = 5000
+
+
+@functools.lru_cache(maxsize=None)
+def _rng() -> np.random.Generator:
+    """ Generator for the batched draws of the vectorized samplers """
+    import numpy as np
+
+    return np.random.default_rng()
 
 
 def comprehensive_test():
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import AutoMinorLocator
+    from matplotlib.widgets import Slider
+    import numpy as np
+
     fig, axs = plt.subplots(3, 3, figsize=(10, 10))
     plt.subplots_adjust(left=0.05, bottom=0.15, right=0.95, top=0.95, wspace=0.2, hspace=0.3)
 
@@ -51,9 +77,55 @@ def comprehensive_test():
     current_temp = 50.
     sun_value = 50
 
+    sims = {
+        state: _manual_sim(1, state, min_temp, avg_temp, max_temp, current_temp)
+        for state in WEATHER_STATES if state != 'sl'
+    }
+
+    # Bars are created once and only have their heights updated by the sliders
+    y_pos = np.arange(11)
+    zeros = np.zeros(11)
+    bars = {}
+    # Weather states fill the 3x3 grid row by row
+    layout = list(zip(itertools.product(range(3), repeat=2), sims))
+    for (j, i), state in layout:
+        axs[j, i].set_title(WEATHER_STATES[state]['name'])
+        axs[j, i].set_xticks(y_pos)
+        axs[j, i].xaxis.set_minor_locator(AutoMinorLocator(n=2))
+        axs[j, i].tick_params(which='minor', direction='in', length=7, top=False)
+        axs[j, i].tick_params(which='major', width=2, top=False, right=False)
+        bars[state] = {
+            'temperature': axs[j, i].bar(
+                y_pos - 3 / 8, zeros, align='center', width=1 / 4, alpha=.75,
+                color=colors['temperature']
+            ),
+            'weather': axs[j, i].bar(
+                y_pos - 1 / 8, zeros, align='center', width=1 / 4, alpha=.75,
+                color=colors['weather']
+            ),
+            'sun_location': axs[j, i].bar(
+                y_pos + 1 / 8, zeros, width=1 / 4, align='center', alpha=.75,
+                color=colors['sun_location']
+            ),
+            'random': axs[j, i].bar(
+                y_pos + 3 / 8, zeros, align='center', width=1 / 4, alpha=.75,
+                color=colors['random']
+            ),
+            'total': axs[j, i].bar(
+                y_pos, zeros, align='center', width=1, alpha=.45, ls='dashed',
+                color=colors['total'], edgecolor='black'
+            )
+        }
+
+    # Last value seen per slider, matplotlib fires on_changed even when a drag lands on the same value
+    last_values = {}
+
     def _wrap_update(variable: str):
         def update(value=None):
             global min_temp, avg_temp, max_temp, current_temp, sun_value
+            if variable in last_values and last_values[variable] == value:
+                return
+            last_values[variable] = value
             if variable == 'current_temp':
                 current_temp = value
             if variable == 'min_temp':
@@ -64,56 +136,23 @@ def comprehensive_test():
                 max_temp = value
             if variable == 'sun_value':
                 sun_value = value
-            i = 0
-            j = 0
-            for state in WEATHER_STATES:
-                if state == 'sl':
-                    continue
-                results = general_test(
-                    weather_state=state, min_temp=min_temp, max_temp=max_temp, avg_temp=avg_temp,
-                    current_temp=current_temp, sun_value=sun_value, count=1000, version=1
-                )
-                axs[j, i].clear()
-                axs[j, i].set_xticks(results[1])
-                axs[j, i].xaxis.set_minor_locator(AutoMinorLocator(n=2))
-                axs[j, i].tick_params(which='minor', direction='in', length=7, top=False)
-                axs[j, i].tick_params(which='major', width=2, top=False, right=False)
-                axs[j, i].bar(
-                    results[1] - 3 / 8, results[0]['temperature'], align='center', width=1 / 4,
-                    alpha=.75,
-                    color=colors['temperature']
-                )
-                axs[j, i].bar(
-                    results[1] - 1 / 8, results[0]['weather'], align='center', width=1 / 4,
-                    alpha=.75,
-                    color=colors['weather']
-                )
-                axs[j, i].bar(
-                    results[1] + 1 / 8, results[0]['sun_location'], width=1 / 4, align='center',
-                    alpha=.75, color=colors['sun_location']
-                )
-                axs[j, i].bar(
-                    results[1] + 3 / 8, results[0]['random'], align='center', width=1 / 4,
-                    alpha=.75,
-                    color=colors['random']
-                )
-                axs[j, i].bar(
-                    results[1], results[0]['total'], align='center', width=1, alpha=.45,
-                    ls='dashed', color=colors['total'], edgecolor='black'
-                )
-                axs[j, i].set_title(WEATHER_STATES[state]['name'])
-                i += 1
-                if i >= 3:
-                    j += 1
-                    i = 0
+            for (j, i), state in layout:
+                sim = sims[state]
+                _set_temps(sim.weather, min_temp, avg_temp, max_temp, current_temp)
+                results = general_test_with_sim(sim, sun_value=sun_value, count=1000)
+                for value_type, container in bars[state].items():
+                    for rect, height in zip(container, results[0][value_type]):
+                        rect.set_height(height)
+                axs[j, i].relim()
+                axs[j, i].autoscale_view(scalex=False)
             fig.canvas.draw_idle()
 
         return update
 
     slider_temp.on_changed(_wrap_update('current_temp'))
-    slider_min_temp.on_changed(_wrap_update('min_value'))
-    slider_avg_temp.on_changed(_wrap_update('avg_value'))
-    slider_max_temp.on_changed(_wrap_update('max_value'))
+    slider_min_temp.on_changed(_wrap_update('min_temp'))
+    slider_avg_temp.on_changed(_wrap_update('avg_temp'))
+    slider_max_temp.on_changed(_wrap_update('max_temp'))
     slider_sun.on_changed(_wrap_update('sun_value'))
     _wrap_update('current_temp')(current_temp)
 
@@ -133,7 +172,42 @@ def general_test(
         count: int = 100,
         **kwargs
 ):
-    sim = BoktaiSim(
+    sim = _manual_sim(version, weather_state, min_temp, avg_temp, max_temp, current_temp)
+    return general_test_with_sim(sim, sun_value=sun_value, count=count, **kwargs)
+
+
+def general_test_with_sim(sim: BoktaiSim, sun_value: float = 50, count: int = 100, **kwargs):
+    import numpy as np
+
+    from ._kernels import score_and_bin, SERIES
+
+    temperature = _scale(_current_temps(sim.weather, count), sim.weather, 0, 10)
+    weather = _scale(
+        _current_temps(sim.weather, count), sim.weather, sim.weather_min, sim.weather_max
+    )
+    sun_location = _sun_values(sun_value, count, **kwargs)
+    random_weather = _triangular(sim.weather_min, sim.weather_avg, sim.weather_max, count)
+    histogram = np.zeros((len(SERIES), 11), dtype=np.int64)
+    score_and_bin(
+        temperature, weather, random_weather, sun_location,
+        float(_STATE_OFFSETS.get(sim.weather.weather_state, 0)), 0., 10., histogram
+    )
+
+    dist = dict(zip(SERIES, histogram.tolist()))
+    y_pos = np.arange(11)
+
+    return dist, y_pos
+
+
+def _manual_sim(
+        version: int,
+        weather_state: str,
+        min_temp: float,
+        avg_temp: float,
+        max_temp: float,
+        current_temp: float
+) -> BoktaiSim:
+    return BoktaiSim(
         version=version,
         manual_data=WeatherInfo(
             state='N/A',
@@ -153,60 +227,79 @@ def general_test(
         )
     )
 
-    i = 0
-    results = {
-        'temperature': {},
-        'weather': {},
-        'sun_location': {},
-        'random': {},
-        'total': {}
-    }
-    for value_type in ('temperature', 'weather', 'sun_location', 'random', 'total'):
-        for j in range(0, 11):
-            results[value_type][j] = 0
-    while i < count:
-        values = {
-            'temperature': sim.temperature_value,
-            'weather': sim.weather_value,
-            'sun_location': sim._calulate_sun_value(sun_value, **kwargs),
-            'random': sim.random_weather_value
-        }
-        # total = (values['temperature'] * 10) + (values['weather'] * 20) + (values['random'] * 25) + (values[
-            # 'sun_location'] * 50)
-        total = (values['temperature'] * 15) + (values['weather'] * 25) + (values['random'] * 20) + (values[
-            'sun_location'] * 40)
-        result = total / 100
-        if weather_state in ('h', 't'):
-            result -= 2
-            if result < 0:
-                result = 0
-        if weather_state in ('hr', 'hc'):
-            result -= 1
-            if result < 0:
-                result = 0
-        if weather_state in ('lc', 's', 'c'):
-            result += 1
-            if result > 10:
-                result = 10
-        values['total'] = result
-        for value_type in ('temperature', 'weather', 'sun_location', 'random', 'total'):
-            results[value_type][round(values[value_type])] += 1
-        i += 1
-    y_pos = np.arange(11)
 
-    dist = {}
-    for value_type in ('temperature', 'weather', 'sun_location', 'random', 'total'):
-        dist[value_type] = []
-        for i in range(0, 11):
-            if i in results[value_type]:
-                dist[value_type].append(results[value_type][i])
-            else:
-                dist[value_type].append(0)
+def _set_temps(
+        weather: WeatherInfo,
+        min_temp: float,
+        avg_temp: float,
+        max_temp: float,
+        current_temp: float
+) -> None:
+    """ Retargets an existing WeatherInfo, widening min/max to current like its __init__ does """
+    weather.min_temp = min(min_temp, current_temp)
+    weather.max_temp = max(max_temp, current_temp)
+    weather.avg_temp = avg_temp
+    weather._current_temp = current_temp
 
-    return dist, y_pos
+
+def _current_temps(weather: WeatherInfo, count: int) -> np.ndarray:
+    """ Batched WeatherInfo.current_temp, which is drawn per read for manual data """
+    import numpy as np
+
+    if not weather.manual:
+        return np.full(count, weather.current_temp)
+    return np.round(
+        _triangular(weather.min_temp, weather.avg_temp, weather.max_temp, count), 2
+    )
+
+
+def _triangular(low: float, mode: float, high: float, count: int) -> np.ndarray:
+    """
+    Batched random.triangular, which tolerates a mode outside [low, high] and low == high where
+    Generator.triangular raises
+    """
+    import numpy as np
+
+    if low == high:
+        return np.full(count, float(low))
+    if low > high:
+        low, high = high, low
+    return _rng().triangular(low, min(max(mode, low), high), high, count)
+
+
+def _scale(values: np.ndarray, weather: WeatherInfo, new_min: float, new_max: float) -> np.ndarray:
+    """ Batched clamp_and_scale of temperatures from the weather's min/max range """
+    import numpy as np
+
+    span = np.maximum(weather.max_temp, values) - weather.min_temp
+    # A collapsed min == max range would divide by zero, treat it as sitting at the top
+    scaled = (values - weather.min_temp) * (new_max - new_min) / np.where(span > 0, span, 1) + new_min
+    return np.where(span > 0, scaled, new_max)
+
+
+def _sun_values(sun_value: float, count: int, **kwargs) -> np.ndarray:
+    """ Batched BoktaiSim._calulate_sun_value """
+    import numpy as np
+
+    if sun_value == 100.0 or sun_value == -1:
+        return np.zeros(count)
+    sun_position, alpha, beta = BoktaiSim._sun_beta_parameters(sun_value, **kwargs)
+    values = _rng().beta(alpha, beta, count) * 10
+    if sun_position <= 5:
+        values = np.where(values > 2, values - 2, values)
+    return values
+
+
+def _histogram(samples: np.ndarray) -> list:
+    """ Counts samples into the 0-10 bar value bins """
+    import numpy as np
+
+    return np.bincount(np.clip(np.rint(samples).astype(np.int64), 0, 10), minlength=11).tolist()
 
 
 def sun_curve_test(sun_value: float = 50, count: int = 100, **kwargs):
+    import numpy as np
+
     sim = BoktaiSim(
         version=2,
         manual_data=WeatherInfo(
@@ -227,49 +320,42 @@ def sun_curve_test(sun_value: float = 50, count: int = 100, **kwargs):
         )
     )
 
-    i = 0
-    results = {}
-    while i < count:
-        result = round(sim._calulate_sun_value(sun_value, **kwargs))
-        if result not in results:
-            results[result] = 1
-        else:
-            results[result] += 1
-        i += 1
-    dist = []
-    for i in range(0, 11):
-        if i in results:
-            dist.append(results[i])
-        else:
-            dist.append(0)
-
-    objects = tuple(range(0, 11))
-    y_pos = np.arange(len(objects))
+    samples = np.fromiter(
+        (sim._calulate_sun_value(sun_value, **kwargs) for _ in range(count)),
+        dtype=np.float64,
+        count=count
+    )
+    dist = _histogram(samples)
+
+    y_pos = np.arange(11)
     return dist, y_pos
 
 
+def _sample_values(sim: BoktaiSim, count: int) -> np.ndarray:
+    import numpy as np
+
+    # Forked workers inherit the parent's random state, reseed so their samples differ
+    random.seed()
+    return np.asarray(sim.values(count), dtype=np.int32)
+
+
 def location_value_test(zipcode: int, count: int = 100, lunar_mode: bool = False, **kwargs):
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     sim = BoktaiSim(version=2, zipcode=zipcode, lunar_mode=lunar_mode)
-    i = 0
-    results = {}
-    while i < count:
-        result = sim.value
-        if result not in results:
-            results[result] = 1
-        else:
-            results[result] += 1
-        i += 1
-    print(results)
-    dist = []
-    for i in range(0, 11):
-        if i in results:
-            dist.append(results[i])
-        else:
-            dist.append(0)
+    workers = max(1, min(os.cpu_count() or 1, count // _MIN_WORKER_SAMPLES))
+    if workers == 1:
+        samples = _sample_values(sim, count)
+    else:
+        chunks = [count // workers + (1 if i < count % workers else 0) for i in range(workers)]
+        with multiprocessing.Pool(workers) as pool:
+            parts = pool.starmap(_sample_values, [(sim, chunk) for chunk in chunks])
+        samples = np.concatenate(parts)
+    dist = _histogram(samples)
     print(dist)
 
-    objects = tuple(range(0, 11))
-    y_pos = np.arange(len(objects))
+    y_pos = np.arange(11)
 
     plt.bar(y_pos, dist, align='center', alpha=0.5)
     plt.xticks(y_pos, tuple(range(0, 11)))
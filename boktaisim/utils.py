@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import functools
 import sys
 
 
+@functools.lru_cache(maxsize=1)
 def get_state():
     if sys.platform == 'darwin':
         system = 'mac'
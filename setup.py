@@ -1,11 +1,12 @@
 #!/usr/bin/var python
 # -*- coding: utf-8 -*-
 
+import os
+import re
 import sys
 #import ez_setup
 #ez_setup.use_setuptools()
 from setuptools import setup
-from glob import glob
 
 
 def readme():
@@ -13,18 +14,15 @@ def readme():
         return f.read()
 
 
-try:
-    from boktaisim.version import __version__
-except ImportError:
-    pass
+with open('boktaisim/version.py') as version_file:
+    __version__ = re.search(r'__version__\s*=\s*[\'"]([^\'"]+)', version_file.read()).group(1)
 
-exec(open('boktaisim/version.py').read())
-
-data_file_paths = glob('boktaisim/resources/*.wav')
-data_file_paths.extend(glob('boktaisim/resources/*.gif'))
-data_file_paths.extend(glob('boktaisim/resources/*.jpg'))
-data_file_paths.extend(glob('boktaisim/resources/*.db'))
-data_file_paths.extend(glob('boktaisim/resources/*.ico'))
+DATA_FILE_EXTENSIONS = {'.wav', '.gif', '.jpg', '.db', '.ico'}
+with os.scandir('boktaisim/resources') as resources:
+    data_file_paths = sorted(
+        entry.path for entry in resources
+        if os.path.splitext(entry.name)[1] in DATA_FILE_EXTENSIONS
+    )
 DATA_FILES = [
     ('resources', data_file_paths),
 ]
@@ -84,9 +82,14 @@ setup(
         'License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)',
         'Natural Language :: English',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8'
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
+        'Programming Language :: Python :: 3.13',
+        'Programming Language :: Python :: 3.14'
     ],
     keywords='gaming',
     url='https://bitbucket.org/c0nch0b4r/boktaisim',
@@ -94,9 +97,8 @@ setup(
     project_urls={
         'Source': 'https://bitbucket.org/c0nch0b4r/boktaisim/src'
     },
-    python_requires='>=3.8, <4',
+    python_requires='>=3.9, <4',
     install_requires=[
-        'typing',
         'requests',
         'pyzipcode',
         'appdirs',
@@ -104,6 +106,9 @@ setup(
         'Pillow',
         'tzlocal'
     ],
+    extras_require={
+        'tests': ['numpy', 'numba', 'matplotlib']
+    },
     entry_points={
         'console_scripts': ['boktaisim=boktaisim.boktaisim:main'],
     },